@@ -8,7 +8,28 @@ from hermespy.modem.waveform_generator_psk_qam import PskQamCorrelationSynchroni
 from hermespy.modem.waveform_generator_chirp_fsk import WaveformGeneratorChirpFsk, ChirpFskCorrelationSynchronization
 from hermespy.core.scenario import Scenario
 from hermespy.simulation import SimulatedDevice
-from hermespy.modem.bits_source import StreamBitsSource
+from hermespy.modem.bits_source import BitsSource
+
+
+class MemoryMappedBitsSource(BitsSource):
+    """Bits source streaming a file through a read-only memory map."""
+
+    def __init__(self, path: str) -> None:
+
+        BitsSource.__init__(self)
+        self.__memory_map = np.memmap(path, dtype=np.uint8, mode='r')
+        self.__position = 0
+
+    def generate_bits(self, num_bits: int) -> np.ndarray:
+
+        start_byte = self.__position // 8
+        stop_byte = (self.__position + num_bits + 7) // 8
+        bit_offset = self.__position - 8 * start_byte
+
+        bits = np.unpackbits(self.__memory_map[start_byte:stop_byte])[bit_offset:bit_offset+num_bits]
+        self.__position += num_bits
+
+        return bits
 
 
 # Create a new HermesPy simulation scenario
@@ -33,7 +54,7 @@ waveform_generator.channel_equalization = PskQamZeroForcingChannelEqualization()
 
 device.sampling_rate = waveform_generator.sampling_rate
 
-source = StreamBitsSource(os.path.join(os.path.dirname(__file__), '../resources/leena.raw'))
+source = MemoryMappedBitsSource(os.path.join(os.path.dirname(__file__), '../resources/leena.raw'))
 leena_num_bits = 512 * 512 * 8
 image_buffer = np.zeros((512, 512), dtype=np.uint8)
 image_buffer[0, 0] = 255
@@ -49,9 +70,18 @@ bits_per_frame = modem.num_data_bits_per_frame
 byte_per_frame = int(bits_per_frame / 8)
 num_frames = int(leena_num_bits / bits_per_frame)
 
+# Number of frames between two refreshes of the displayed image
+frames_per_refresh = 32
+
 plt.ion()
 fig, axes = plt.subplots()
-image = axes.imshow(image_buffer)
+image = axes.imshow(image_buffer, animated=True)
+plt.show(block=False)
+fig.canvas.draw()
+
+# Received bits are collected and only packed into the image on refreshes
+received_bits = np.zeros(num_frames * bits_per_frame, dtype=np.uint8)
+num_packed_frames = 0
 
 for f in range(num_frames):
 
@@ -61,9 +91,20 @@ for f in range(num_frames):
     rx_signal, rx_symbols, data_bits = modem.receive()
 
     if len(data_bits) > 0:
-        image_buffer.flat[f*byte_per_frame:(f+1)*byte_per_frame] = np.packbits(data_bits)
-    image.set_data(image_buffer)
-    fig.canvas.flush_events()
+        received_bits[f*bits_per_frame:(f+1)*bits_per_frame] = data_bits
+
+    # Redrawing the canvas is by far the most expensive operation,
+    # so only the image artist is blitted every few frames
+    if f % frames_per_refresh == 0 or f == num_frames - 1:
+
+        image_buffer.flat[num_packed_frames*byte_per_frame:(f+1)*byte_per_frame] = \
+            np.packbits(received_bits[num_packed_frames*bits_per_frame:(f+1)*bits_per_frame])
+        num_packed_frames = f + 1
+
+        image.set_data(image_buffer)
+        axes.draw_artist(image)
+        fig.canvas.blit(axes.bbox)
+        fig.canvas.flush_events()
 
 input("Press Enter to continue...")
 plt.close()
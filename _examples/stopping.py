@@ -1,56 +1,74 @@
 import numpy as np
-import numpy.random as rnd
-from math import exp, sqrt
 from scipy.constants import pi
-from scipy.stats import norm
+from scipy.special import ndtr
 
 tolerance = .1        # Allowed difference between true and estimated RV mean
 confidence = .1       # Probability that the tolerance was achieved
 min_num_samples = 50  #
+max_num_samples = 1000000
 
-samples = np.empty(0, dtype=float)
-sample_mean = np.nan
+rng = np.random.default_rng()
 confidence_estimate = np.nan
-required_num_samples = min_num_samples
 
 # Berry-Esseen constants
 C_0 = .4785
 C_1 = 30.2338
 
-cbe = lambda x: min(C_0, C_1 * (1 + abs(x)) ** -3)
 
-for n in range(1, 1000000):
+def cbe(x: np.ndarray) -> np.ndarray:
 
-    samples = np.append(samples, rnd.standard_normal())
+    t = 1. + np.abs(x)
+    return np.minimum(C_0, C_1 / (t * t * t))
 
-    if n < required_num_samples:
-        continue
 
-    # Compute moments
-    sample_mean = np.mean(samples)
-    unbiased_samples = samples - sample_mean
-    sigma_moment = sqrt(np.sum(unbiased_samples ** 2) / n)
-    beta_bar_moment = np.sum(np.abs(unbiased_samples) ** 3) / (n * sigma_moment ** 3)
-    beta_hat_moment = np.sum(unbiased_samples ** 3) / (n * sigma_moment ** 3)
-    kappa_moment = np.sum(unbiased_samples ** 4) / (n * sigma_moment ** 4) - 3
+# Doubling schedule of sample counts at which the confidence is checked
+num_checks = int(np.log2(max_num_samples / min_num_samples)) + 1
+ns = min_num_samples * 2 ** np.arange(num_checks)
 
-    # Estimate the confidence
-    sample_sqrt = sqrt(n)
-    sigma_tolerance = sample_sqrt * tolerance / sigma_moment
-    sigma_tolerance_squared = sigma_tolerance ** 2
-    kappa_term = 4 * (2 / (n - 1) + kappa_moment / n)
+samples = rng.standard_normal(ns[-1])
 
-    confidence_bound = 2 * (1 - norm.cdf(sigma_tolerance)) \
-        + 2 * cbe(sigma_tolerance) * beta_bar_moment / sample_sqrt * min(1, kappa_term) \
-        + abs(sigma_tolerance_squared - 1) * abs(beta_hat_moment) / (exp(.5 * sigma_tolerance_squared) *
-                                                                     3 * sqrt(2 * pi * n) * sigma_moment ** 3) \
-        * max(1 - kappa_term, 0)
+# Power sums of the samples at each check
+samples_squared = samples * samples
+S1 = np.cumsum(samples)[ns - 1]
+S2 = np.cumsum(samples_squared)[ns - 1]
+S3 = np.cumsum(samples_squared * samples)[ns - 1]
+S4 = np.cumsum(samples_squared * samples_squared)[ns - 1]
 
-    if confidence_bound < confidence:
-        break
+# Compute central moments from the power sums
+sample_means = S1 / ns
+means_squared = sample_means ** 2
+m2 = S2 / ns - means_squared
+m3 = S3 / ns - 3 * sample_means * m2 - sample_means * means_squared
+m4 = S4 / ns - 4 * sample_means * m3 - 6 * means_squared * m2 - means_squared ** 2
 
-    else:
-        required_num_samples = 2 * n
-        print(required_num_samples)
+# The absolute third moment can't be expressed in power sums,
+# it is therefore computed by a single pass for each of the (logarithmically many) checks
+sigma_moment = np.sqrt(m2)
+beta_bar_moment = np.array([np.sum(np.abs(samples[:n] - mean) ** 3) for n, mean in zip(ns, sample_means)]) \
+    / (ns * sigma_moment ** 3)
+beta_hat_moment = m3 / sigma_moment ** 3
+kappa_moment = m4 / sigma_moment ** 4 - 3
+
+# Estimate the confidence
+sample_sqrt = np.sqrt(ns)
+sigma_tolerance = sample_sqrt * tolerance / sigma_moment
+sigma_tolerance_squared = sigma_tolerance ** 2
+kappa_term = 4 * (2 / (ns - 1) + kappa_moment / ns)
+
+confidence_bound = 2 * (1 - ndtr(sigma_tolerance)) \
+    + 2 * cbe(sigma_tolerance) * beta_bar_moment / sample_sqrt * np.minimum(1, kappa_term) \
+    + np.abs(sigma_tolerance_squared - 1) * np.abs(beta_hat_moment) * np.exp(-.5 * sigma_tolerance_squared) \
+    / (3 * np.sqrt(2 * pi * ns) * sigma_moment ** 3) * np.maximum(1 - kappa_term, 0)
+
+# Stop at the first check achieving the requested confidence.
+# If no check does, twice the samples of the last check are required, as in the sequential procedure
+confident = confidence_bound < confidence
+num_failed_checks = int(np.argmax(confident)) if np.any(confident) else num_checks
+
+for n in ns[:num_failed_checks]:
+    print(2 * n)
+
+required_num_samples = ns[num_failed_checks] if num_failed_checks < num_checks else 2 * ns[-1]
+sample_mean = sample_means[min(num_failed_checks, num_checks - 1)]
 
 print(f"Required {required_num_samples} samples to estimate the mean to {sample_mean} with a confidence of {confidence_estimate}")
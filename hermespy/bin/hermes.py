@@ -48,18 +48,29 @@ The available argument options are
    * - -t
      - Run the CLI in test mode
 
+   * - --no-cache
+     - Parse the configuration files instead of recalling them from the cache
+
 """
 import os
+import pickle
 import shutil
 import sys
 import argparse
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, wait
+from hashlib import blake2b
+from tempfile import mkdtemp
+from typing import Any, BinaryIO, List, Optional
+
+from numpy.random import default_rng
 
 from ruamel.yaml.constructor import ConstructorError
+from ruamel.yaml.main import CParser
 from rich.console import Console
 
 from hermespy.core.executable import Executable
 from hermespy.core.factory import Serializable, Factory
+from hermespy.core.random_node import RandomNode
 
 __author__ = "André Noll Barreto"
 __copyright__ = "Copyright 2022, Barkhausen Institut gGmbH"
@@ -71,6 +82,190 @@ __email__ = "jan.adler@barkhauseninstitut.org"
 __status__ = "Prototype"
 
 
+def _cache_dir() -> str:
+    """Directory in which deserialized configurations are cached.
+
+    Located within the user's cache directory, i.e. `$XDG_CACHE_HOME/hermespy`, defaulting to `~/.cache/hermespy`.
+
+    Returns:
+        str: Path to the cache directory.
+    """
+
+    cache_home = os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache'))
+    return os.path.join(cache_home, 'hermespy')
+
+
+def _settings_hash(input_parameters_dir: str) -> str:
+    """Fingerprint the state of all configuration files within a settings directory.
+
+    The fingerprint includes the HermesPy version and source files,
+    so that caches are invalidated by updates of the class implementations.
+    Files referenced by the configuration from outside the settings directory are not considered.
+
+    Args:
+
+        input_parameters_dir (str):
+            Settings directory from which the configuration is read.
+
+    Returns:
+        str: Hash over the paths, modification times and sizes of all configuration and source files.
+    """
+
+    fingerprint = blake2b()
+    fingerprint.update(f"{__version__};{sys.version};".encode())
+
+    hermes_root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    considered_files = [(input_parameters_dir, Factory.extensions), (hermes_root_dir, ['.py'])]
+
+    for root_dir, extensions in considered_files:
+        for directory, _, files in sorted(os.walk(os.path.abspath(root_dir))):
+            for file in sorted(files):
+
+                if os.path.splitext(file)[1] not in extensions:
+                    continue
+
+                file_path = os.path.join(directory, file)
+                stat = os.stat(file_path)
+                fingerprint.update(f"{file_path}:{stat.st_mtime_ns}:{stat.st_size};".encode())
+
+    return fingerprint.hexdigest()
+
+
+class _FreshGenerator(object):
+    """Placeholder unpickling to a pseudo-random number generator initialized from fresh entropy."""
+
+    def __reduce__(self):
+        return default_rng, ()
+
+
+class _CachePickler(pickle.Pickler):
+    """Pickler excluding the random state of unseeded random nodes.
+
+    Unseeded configurations are expected to draw independent random streams on each run,
+    their generators are therefore re-initialized from fresh entropy when recalled from the cache.
+    """
+
+    __protocol: int     # Pickle protocol version
+
+    def __init__(self, file: BinaryIO, protocol: int = pickle.HIGHEST_PROTOCOL) -> None:
+
+        pickle.Pickler.__init__(self, file, protocol=protocol)
+        self.__protocol = protocol
+
+    def reducer_override(self, obj: Any) -> Any:
+
+        if not isinstance(obj, RandomNode) or obj.seed is not None or not obj.is_random_root:
+            return NotImplemented
+
+        reduction = list(obj.__reduce_ex__(self.__protocol))
+        state = reduction[2]
+
+        if isinstance(state, dict) and '_RandomNode__generator' in state:
+
+            state = state.copy()
+            state['_RandomNode__generator'] = _FreshGenerator()
+            reduction[2] = state
+
+        return tuple(reduction)
+
+
+def _load_serializables(input_parameters_dir: str,
+                        use_cache: bool = True) -> List[Serializable]:
+    """Load serializable objects from a settings directory.
+
+    Parsing YAML is slow, deserialized objects are therefore cached as a pickle within the user's cache directory
+    and recalled as long as neither the configuration files nor the HermesPy installation change.
+
+    Args:
+
+        input_parameters_dir (str):
+            Settings directory from which the configuration is read.
+
+        use_cache (bool, optional):
+            Recall and store deserialized objects from the cache.
+            Enabled by default.
+
+    Returns:
+        List[Serializable]: Serializable HermesPy objects.
+    """
+
+    if not use_cache or not os.path.isdir(input_parameters_dir):
+        return Factory().load(input_parameters_dir)
+
+    cache_path = os.path.join(_cache_dir(), _settings_hash(input_parameters_dir) + '.pkl')
+
+    # Recall the cached objects if the configuration is unchanged
+    try:
+
+        with open(cache_path, 'rb') as cache:
+            return pickle.load(cache)
+
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError, ValueError):
+        pass
+
+    serializables: List[Serializable] = Factory().load(input_parameters_dir)
+
+    # Caching is a mere optimization, failing to pickle or to write the cache is therefore not an error
+    try:
+
+        os.makedirs(_cache_dir(), exist_ok=True)
+        with open(cache_path, 'wb') as cache:
+            _CachePickler(cache).dump(serializables)
+
+    except (OSError, pickle.PicklingError, TypeError, AttributeError):
+
+        if os.path.exists(cache_path):
+            os.remove(cache_path)
+
+    return serializables
+
+
+def _copy_file(source: str, destination: str) -> str:
+    """Copy a single file in-kernel, if supported by the platform.
+
+    Uses `copy_file_range`, which shares data blocks on copy-on-write file systems,
+    and falls back to :func:`shutil.copy2` otherwise.
+
+    Args:
+
+        source (str):
+            Path to the file to be copied.
+
+        destination (str):
+            Path the file will be copied to.
+
+    Returns:
+        str: Path to the copied file.
+    """
+
+    if not hasattr(os, 'copy_file_range'):
+        return shutil.copy2(source, destination)
+
+    try:
+
+        with open(source, 'rb') as source_file, open(destination, 'wb') as destination_file:
+
+            num_remaining_bytes = os.fstat(source_file.fileno()).st_size
+            while num_remaining_bytes > 0:
+
+                num_copied_bytes = os.copy_file_range(source_file.fileno(), destination_file.fileno(),
+                                                      num_remaining_bytes)
+
+                if num_copied_bytes < 1:
+                    break
+
+                num_remaining_bytes -= num_copied_bytes
+
+        if num_remaining_bytes > 0:
+            return shutil.copy2(source, destination)
+
+    except OSError:
+        return shutil.copy2(source, destination)
+
+    shutil.copystat(source, destination)
+    return destination
+
+
 def hermes(args: Optional[List[str]] = None) -> None:
     """HermesPy Command Line Interface.
 
@@ -94,6 +289,7 @@ def hermes(args: Optional[List[str]] = None) -> None:
     parser.add_argument("-s", help="style of result plots", type=str)
     parser.add_argument('-t', '--test', action='store_true', help='run in test-mode, does not dump results')
     parser.add_argument('-l', '--log', action='store_true', help='log the console information to a txt file')
+    parser.add_argument('--no-cache', action='store_true', help='always parse the configuration files')
 
     arguments = parser.parse_args(args)
     input_parameters_dir = arguments.p
@@ -123,43 +319,71 @@ def hermes(args: Optional[List[str]] = None) -> None:
 
     console.log(f"Configuration will be read from '{input_parameters_dir}'")
 
-    with console.status("Initializing Environment...", spinner='dots'):
+    if CParser is None:
+        console.log("LibYAML bindings are not available, configuration parsing falls back to pure Python. "
+                    "Install ruamel.yaml.clib for faster startups", style="yellow")
 
-        ##################
-        # Import executable from YAML config dump
-        factory = Factory()
+    # The results directory is determined and validated ahead of loading the configuration,
+    # so that the configuration can be copied while it is being parsed
+    created_results_dir = results_dir is None
+    if created_results_dir:
+        results_dir = Executable.default_results_dir()
+
+    elif not os.path.isdir(results_dir):
+        raise ValueError("The provided results directory does not exist")
+
+    with console.status("Initializing Environment...", spinner='dots'), ThreadPoolExecutor(max_workers=1) as pool:
+
+        # Dump current configuration to a staging directory,
+        # which is only merged into the results directory once the configuration has been loaded successfully
+        staging_dir = None if arguments.test else mkdtemp(prefix='.configuration_', dir=results_dir)
+        configuration_copy = None if staging_dir is None else \
+            pool.submit(shutil.copytree, input_parameters_dir, staging_dir, dirs_exist_ok=True,
+                        copy_function=_copy_file)
 
         try:
 
-            # Load serializable objects from configuration files
-            serializables: List[Serializable] = factory.load(input_parameters_dir)
+            ##################
+            # Import executable from YAML config dump
+            try:
 
-            # Filter out non-executables from the serialization list
-            executables: List[Executable] = [s for s in serializables if isinstance(s, Executable)]
+                # Load serializable objects from configuration files
+                serializables: List[Serializable] = _load_serializables(input_parameters_dir, not arguments.no_cache)
 
-            # Abort execution if no executable was found
-            if len(executables) < 1:
+                # Filter out non-executables from the serialization list
+                executables: List[Executable] = [s for s in serializables if isinstance(s, Executable)]
 
-                console.log("No executable routine was detected, aborting execution", style="red")
-                exit(-1)
+                # Abort execution if no executable was found
+                if len(executables) < 1:
 
-            # For now, only single executables are supported
-            executable = executables[0]
+                    console.log("No executable routine was detected, aborting execution", style="red")
+                    exit(-1)
 
-            # Configure executable
-            if results_dir is None:
-                executable.results_dir = Executable.default_results_dir()
+                # For now, only single executables are supported
+                executable = executables[0]
 
-            else:
+                # Configure executable
                 executable.results_dir = results_dir
 
-        except ConstructorError as error:
+            except ConstructorError as error:
+
+                print("\nYAML import failed during parsing of line {} in file '{}':\n\t{}".format(
+                    error.problem_mark.line, error.problem_mark.name, error.problem, file=sys.stderr))
+                exit(-1)
 
-            print("\nYAML import failed during parsing of line {} in file '{}':\n\t{}".format(error.problem_mark.line,
-                                                                                              error.problem_mark.name,
-                                                                                              error.problem,
-                                                                                              file=sys.stderr))
-            exit(-1)
+        except BaseException:
+
+            # Failed loads leave no trace within the results directory
+            if configuration_copy is not None:
+
+                configuration_copy.cancel()
+                wait([configuration_copy])
+                shutil.rmtree(staging_dir, ignore_errors=True)
+
+            if created_results_dir:
+                shutil.rmtree(results_dir, ignore_errors=True)
+
+            raise
 
         # Configure console
         executable.console = console
@@ -171,9 +395,13 @@ def hermes(args: Optional[List[str]] = None) -> None:
         # Inform about the results directory
         console.log("Results will be saved in '{}'".format(executable.results_dir))
 
-        # Dump current configuration to results directory
-        if not arguments.test:
-            shutil.copytree(input_parameters_dir, executable.results_dir, dirs_exist_ok=True)
+        # Wait for the configuration dump to finish, re-raising any errors,
+        # and move the staged files into the results directory
+        if configuration_copy is not None:
+
+            configuration_copy.result()
+            shutil.copytree(staging_dir, results_dir, dirs_exist_ok=True, copy_function=os.replace)
+            shutil.rmtree(staging_dir)
 
     ##################
     # run simulation
@@ -7,7 +7,7 @@ Channel Modeling
 
 from __future__ import annotations
 from typing import List, Optional, Tuple, Type, Union
-from itertools import chain, product
+from itertools import chain
 
 import numpy as np
 from ruamel.yaml import SafeRepresenter, MappingNode
@@ -427,25 +427,24 @@ class Channel(SerializableArray, RandomNode):
 
         # The maximum delay in samples is modeled by the last impulse response dimension
         num_delay_samples = impulse_response.shape[3] - 1
-        num_tx_streams = impulse_response.shape[2]
-        num_rx_streams = impulse_response.shape[1]
 
         # Propagate the signal
         propagated_samples = np.zeros((impulse_response.shape[1],
                                        signal.num_samples + num_delay_samples), dtype=complex)
 
+        # Mix the transmitted streams onto all receive streams at once for each delay tap
         for delay_index in range(num_delay_samples+1):
-            for tx_idx, rx_idx in product(range(num_tx_streams), range(num_rx_streams)):
 
-                delayed_signal = impulse_response[:, rx_idx, tx_idx, delay_index] * signal.samples[tx_idx, :]
-                propagated_samples[rx_idx, delay_index:delay_index+signal.num_samples] += delayed_signal
+            delayed_signal = np.einsum('nrt,tn->rn', impulse_response[:, :, :, delay_index], signal.samples)
+            propagated_samples[:, delay_index:delay_index+signal.num_samples] += delayed_signal
 
         return Signal(propagated_samples, sampling_rate=signal.sampling_rate,
                       carrier_frequency=signal.carrier_frequency, delay=signal.delay+delay)
 
     def impulse_response(self,
                          num_samples: int,
-                         sampling_rate: float) -> np.ndarray:
+                         sampling_rate: float,
+                         dtype: Type[np.complexfloating] = np.complex128) -> np.ndarray:
         """Sample a new channel impulse response.
 
         Note that this is the core routine from which `propagate` will create the channel state.
@@ -458,6 +457,11 @@ class Channel(SerializableArray, RandomNode):
             sampling_rate (float):
                 The rate at which the delay taps will be sampled, i.e. the delay resolution.
 
+            dtype (Type[np.complexfloating], optional):
+                Data type of the impulse response.
+                Double precision by default,
+                single precision halves the memory footprint of large responses.
+
         Returns:
             np.ndarray:
                 Impulse response in all `number_rx_antennas` x `number_tx_antennas`.
@@ -471,18 +475,18 @@ class Channel(SerializableArray, RandomNode):
 
         # MISO case
         if self.receiver.num_antennas == 1:
-            impulse_responses = np.tile(np.ones((1, self.transmitter.num_antennas), dtype=complex),
+            impulse_responses = np.tile(np.ones((1, self.transmitter.num_antennas), dtype=dtype),
                                         (num_samples, 1, 1))
 
         # SIMO case
         elif self.transmitter.num_antennas == 1:
-            impulse_responses = np.tile(np.ones((self.receiver.num_antennas, 1), dtype=complex),
+            impulse_responses = np.tile(np.ones((self.receiver.num_antennas, 1), dtype=dtype),
                                         (num_samples, 1, 1))
 
         # MIMO case
         else:
             impulse_responses = np.tile(np.eye(self.receiver.num_antennas, self.transmitter.num_antennas,
-                                               dtype=complex), (num_samples, 1, 1))
+                                               dtype=dtype), (num_samples, 1, 1))
 
         # Scale by channel gain and add dimension for delay response
         impulse_responses = self.gain * np.expand_dims(impulse_responses, axis=3)
@@ -6,15 +6,14 @@ Multipath Fading
 """
 
 from __future__ import annotations
-from itertools import product
-from typing import Any, Optional, Type, Union, List
+from typing import Any, Dict, Optional, Tuple, Type, Union, List
 
 import numpy as np
-from numpy import cos, exp
+from numba import jit
+from numpy import cos
 from ruamel.yaml import SafeRepresenter, MappingNode, SafeConstructor
 from scipy.constants import pi
 
-from ..tools import delay_resampling_matrix
 from .channel import Channel
 
 __author__ = "Andre Noll Barreto"
@@ -72,11 +71,21 @@ class MultipathFadingChannel(Channel):
         __max_delay (float): Maximum propagation delay in seconds.
         __num_resolvable paths (int): Number of resolvable paths within the multipath model.
         __num_sinusoids (int): Number of sinusoids components per sample sequence.
+        __sinusoid_angles (np.ndarray): Constant angular offset of each sinusoid component.
+        __sinusoid_normalization (float): Amplitude normalization of the sinusoid components.
+        __phase_scales (np.ndarray): Ranges of the random angles and phases drawn for each path.
         __los_angle (Optional[float]): Line of sight angle of arrival.
-        los_gains (np.array): Path gains for line of sight component in sample sequence, derived from rice factor
-        non_los_gains (np.array): Path gains for non-line of sight in sample sequence, derived from rice factor
+        __los_gains (np.array): Path gains for line of sight component in sample sequence, derived from rice factor
+        __non_los_gains (np.array): Path gains for non-line of sight in sample sequence, derived from rice factor
+        __path_parameters (np.ndarray): Read-only block of all per-path parameters, one row per parameter.
+        __los_amplitudes (np.ndarray): Line of sight path gains scaled by the square root of the power profile.
+        __non_los_amplitudes (np.ndarray): Non-line of sight path gains scaled by the square root of the power profile.
         __doppler_frequency (float): Doppler frequency in Hz.
         __los_doppler_frequency (Optional[float]): Optional doppler frequency for the line of sight component.
+        __interpolation_filters (Dict[Tuple[float, np.dtype], np.ndarray]): Cached interpolation filters.
+        __sampling_key (Optional[Tuple[int, float]]): Number of samples and sampling rate of the cached timestamps.
+        __timestamps (np.ndarray): Cached sampling timestamps of the most recent impulse response.
+        __max_delay_in_samples (int): Cached maximum path delay of the most recent impulse response in samples.
         interpolate_signals (bool): Interpolate signals during time-delay modeling. Disabled by default.
     """
 
@@ -89,10 +98,21 @@ class MultipathFadingChannel(Channel):
     __max_delay: float
     __num_resolvable_paths: int
     __num_sinusoids: int
+    __sinusoid_angles: np.ndarray
+    __sinusoid_normalization: float
+    __phase_scales: np.ndarray
     __los_angle: Optional[float]
-    los_gains: np.ndarray
+    __los_gains: np.ndarray
+    __non_los_gains: np.ndarray
+    __path_parameters: np.ndarray
+    __los_amplitudes: np.ndarray
+    __non_los_amplitudes: np.ndarray
     __doppler_frequency: float
     __los_doppler_frequency: Optional[float]
+    __interpolation_filters: Dict[Tuple[float, np.dtype], np.ndarray]
+    __sampling_key: Optional[Tuple[int, float]]
+    __timestamps: np.ndarray
+    __max_delay_in_samples: int
     interpolate_signals: bool
 
     def __init__(self,
@@ -187,7 +207,9 @@ class MultipathFadingChannel(Channel):
         self.__delays = self.__delays[sorting]
         self.__power_profile = self.__power_profile[sorting]
         self.__rice_factors = self.__rice_factors[sorting]
-        self.__num_sinusoids = 20 if num_sinusoids is None else num_sinusoids
+        self.__interpolation_filters = {}
+        self.__sampling_key = None
+        self.num_sinusoids = 20 if num_sinusoids is None else num_sinusoids
         self.los_angle = los_angle
         self.doppler_frequency = 0.0 if doppler_frequency is None else doppler_frequency
         self.__los_doppler_frequency = None
@@ -202,15 +224,29 @@ class MultipathFadingChannel(Channel):
 
         rice_inf_pos = np.isposinf(self.__rice_factors)
         rice_num_pos = np.invert(rice_inf_pos)
-        self.los_gains = np.empty(self.num_resolvable_paths, dtype=float)
-        self.non_los_gains = np.empty(self.num_resolvable_paths, dtype=float)
+        self.__los_gains = np.empty(self.num_resolvable_paths, dtype=float)
+        self.__non_los_gains = np.empty(self.num_resolvable_paths, dtype=float)
 
-        self.los_gains[rice_inf_pos] = 1.0
-        self.los_gains[rice_num_pos] = np.sqrt(self.__rice_factors[rice_num_pos] /
-                                               (1 + self.__rice_factors[rice_num_pos]))
+        self.__los_gains[rice_inf_pos] = 1.0
+        self.__los_gains[rice_num_pos] = np.sqrt(self.__rice_factors[rice_num_pos] /
+                                                 (1 + self.__rice_factors[rice_num_pos]))
 
-        self.non_los_gains[rice_num_pos] = 1 / np.sqrt(1 + self.__rice_factors[rice_num_pos])
-        self.non_los_gains[rice_inf_pos] = 0.0
+        self.__non_los_gains[rice_num_pos] = 1 / np.sqrt(1 + self.__rice_factors[rice_num_pos])
+        self.__non_los_gains[rice_inf_pos] = 0.0
+
+        # The power profile and gains are fixed, so the amplitude of each path component can be computed once
+        path_amplitudes = np.sqrt(self.__power_profile)
+
+        # Store all per-path parameters within a single contiguous read-only block, one row per parameter.
+        # The individual parameter attributes are views of the block's rows
+        self.__path_parameters = np.stack((self.__delays, self.__power_profile, self.__rice_factors,
+                                           self.__los_gains, self.__non_los_gains,
+                                           path_amplitudes * self.__los_gains,
+                                           path_amplitudes * self.__non_los_gains)).astype(float)
+        self.__path_parameters.flags.writeable = False
+
+        (self.__delays, self.__power_profile, self.__rice_factors, self.__los_gains, self.__non_los_gains,
+         self.__los_amplitudes, self.__non_los_amplitudes) = self.__path_parameters
 
     @property
     def delays(self) -> np.ndarray:
@@ -242,6 +278,30 @@ class MultipathFadingChannel(Channel):
 
         return self.__rice_factors
 
+    @property
+    def los_gains(self) -> np.ndarray:
+        """Path gains of the line of sight components.
+
+        Derived from the rice factors during initialization.
+
+        Returns:
+            np.ndarray: Read-only line of sight gain of each path.
+        """
+
+        return self.__los_gains
+
+    @property
+    def non_los_gains(self) -> np.ndarray:
+        """Path gains of the non-line of sight components.
+
+        Derived from the rice factors during initialization.
+
+        Returns:
+            np.ndarray: Read-only non-line of sight gain of each path.
+        """
+
+        return self.__non_los_gains
+
     @property
     def doppler_frequency(self) -> float:
         """Access doppler frequency shift.
@@ -331,6 +391,15 @@ class MultipathFadingChannel(Channel):
 
         self.__num_sinusoids = num
 
+        # The angular offsets and normalization only depend on the number of sinusoids
+        self.__sinusoid_angles = 2 * pi * np.arange(num) / num if num > 0 else np.empty(0, dtype=float)
+        self.__sinusoid_normalization = num ** -.5 if num > 0 else 0.
+
+        # Random sinusoid angles are confined to the spacing between the angular offsets,
+        # sinusoid phases and the line of sight angle and phase cover the full circle
+        self.__phase_scales = np.full(2 * num + 2, 2 * pi)
+        self.__phase_scales[:num] /= max(num, 1)
+
     @property
     def los_angle(self) -> Optional[float]:
         """Access configured angle of arrival of the specular model component.
@@ -351,39 +420,67 @@ class MultipathFadingChannel(Channel):
 
         self.__los_angle = angle
 
-    def impulse_response(self, num_samples: int, sampling_rate: float) -> np.ndarray:
+    def impulse_response(self,
+                         num_samples: int,
+                         sampling_rate: float,
+                         dtype: Type[np.complexfloating] = np.complex128) -> np.ndarray:
+
+        # Drops usually share their sampling configuration, so the timestamps are only regenerated on changes
+        sampling_key = (num_samples, sampling_rate)
+        if sampling_key != self.__sampling_key:
 
-        max_delay_in_samples = int(self.__delays[-1] * sampling_rate)
-        timestamps = np.arange(num_samples) / sampling_rate
+            self.__timestamps = np.arange(num_samples) / sampling_rate
+            self.__timestamps.flags.writeable = False
+            self.__max_delay_in_samples = int(self.__delays[-1] * sampling_rate)
+            self.__sampling_key = sampling_key
+
+        max_delay_in_samples = self.__max_delay_in_samples
+        timestamps = self.__timestamps
 
         impulse_response = np.zeros((num_samples,
                                      self.receiver.num_antennas,
                                      self.transmitter.num_antennas,
-                                     max_delay_in_samples + 1), dtype=complex)
+                                     max_delay_in_samples + 1), dtype=dtype)
 
         interpolation_filter: Optional[np.ndarray] = None
         if self.impulse_response_interpolation:
-            interpolation_filter = self.interpolation_filter(sampling_rate)
+            interpolation_filter = self.interpolation_filter(sampling_rate, np.finfo(dtype).dtype)
+
+        # Generate independent fading sequences of all paths for each antenna pair at once.
+        # The channel gain is applied to the path amplitudes instead of the full impulse response
+        num_rx_antennas = self.receiver.num_antennas
+        num_tx_antennas = self.transmitter.num_antennas
+        path_weights = self.__taps(timestamps,
+                                   np.tile(self.gain * self.__los_amplitudes, num_rx_antennas * num_tx_antennas),
+                                   np.tile(self.gain * self.__non_los_amplitudes, num_rx_antennas * num_tx_antennas),
+                                   dtype)
+        path_weights = path_weights.reshape((num_rx_antennas, num_tx_antennas, self.num_resolvable_paths, num_samples))
+
+        if interpolation_filter is not None:
 
-        for power, path_idx, los_gain, nlos_gain in zip(self.__power_profile, range(self.num_resolvable_paths),
-                                                        self.los_gains, self.non_los_gains):
+            # Superimpose the interpolated paths of all antenna pairs at once
+            np.einsum('rxpt,pd->trxd', path_weights, interpolation_filter, out=impulse_response, optimize=True)
 
-            for rx_idx, tx_idx in product(range(self.transmitter.num_antennas), range(self.receiver.num_antennas)):
-                signal_weights = power ** .5 * self.__tap(timestamps, los_gain, nlos_gain)
+        else:
+
+            # Scatter the paths of all antenna pairs onto their delay taps
+            delay_indices = (self.__delays * sampling_rate).astype(int)
+            tap_weights = path_weights.transpose((3, 0, 1, 2))
 
-                if interpolation_filter is not None:
-                    impulse_response[:, rx_idx, tx_idx, :] += np.outer(signal_weights,
-                                                                       interpolation_filter[path_idx, :])
+            # Delays are sorted, so paths only share a tap if the indices do not strictly increase.
+            # Shared taps require unbuffered accumulation, which is considerably slower than a plain assignment
+            if np.all(np.diff(delay_indices) > 0):
+                impulse_response[:, :, :, delay_indices] = tap_weights
 
-                else:
-                    delay_idx = int(self.__delays[path_idx] * sampling_rate)
-                    impulse_response[:, rx_idx, tx_idx, delay_idx] += signal_weights
+            else:
+                np.add.at(impulse_response, (slice(None), slice(None), slice(None), delay_indices), tap_weights)
 
-        return self.gain * impulse_response
+        return impulse_response
 
-    def __tap(self, timestamps: np.ndarray,
-              los_gain: complex, nlos_gain: complex) -> np.ndarray:
-        """Generate a single fading sequence tap.
+    def __taps(self, timestamps: np.ndarray,
+               los_gains: np.ndarray, nlos_gains: np.ndarray,
+               dtype: Type[np.complexfloating] = np.complex128) -> np.ndarray:
+        """Generate the fading sequence taps of multiple paths.
 
         Implements equation (18) of the underlying paper.
 
@@ -392,40 +489,120 @@ class MultipathFadingChannel(Channel):
             timestamps (np.ndarray):
                 Time instances at which the channel should be sampled.
 
-            los_gain (complex):
-                Gain of the line-of-sight (specular) model component.
+            los_gains (np.ndarray):
+                Gains of the line-of-sight (specular) model component for each path.
+
+            nlos_gains (np.ndarray):
+                Gains of the non-line-of-sight model components for each path.
 
-            nlos_gain (complex):
-                Gain of the non-line-of-sight model components.
+            dtype (Type[np.complexfloating], optional):
+                Data type of the generated taps.
+                The sinusoids are summed in double precision regardless.
 
         Returns:
 
             np.ndarray:
-                Channel gains at requested timestamps.
+                Channel gains at requested timestamps, one row per path.
         """
 
-        nlos_doppler = self.doppler_frequency
-        nlos_angles = self._rng.uniform(0, 2*pi, self.num_sinusoids)
-        nlos_phases = self._rng.uniform(0, 2*pi, self.num_sinusoids)
+        num_paths = len(los_gains)
 
-        nlos_component = np.zeros(len(timestamps), dtype=complex)
-        for s in range(self.num_sinusoids):
+        # Draw all random angles and phases with a single call, scaled to their respective ranges at once
+        num_sinusoids = self.num_sinusoids
+        random_phases = self._rng.random((num_paths, 2 * num_sinusoids + 2))
+        random_phases *= self.__phase_scales
 
-            nlos_component += exp(1j * (nlos_doppler * timestamps * cos((2*pi*s + nlos_angles[s]) / self.num_sinusoids) +
-                                        nlos_phases[s]))
-
-        nlos_component *= nlos_gain * (self.num_sinusoids ** -.5)
+        nlos_angles = random_phases[:, :num_sinusoids]
+        nlos_phases = random_phases[:, num_sinusoids:2*num_sinusoids]
+        nlos_frequencies = cos(self.__sinusoid_angles + nlos_angles)
 
         if self.los_angle is not None:
-            los_angle = self.los_angle
+            los_angles = np.full(num_paths, self.los_angle)
 
         else:
-            los_angle = self._rng.uniform(0, 2*pi)
+            los_angles = random_phases[:, -2]
+
+        los_phases = random_phases[:, -1]
+
+        taps = np.empty((num_paths, len(timestamps)), dtype=dtype)
+        self.__tap_kernel(taps, timestamps.astype(float),
+                          nlos_frequencies, nlos_phases, float(self.doppler_frequency),
+                          nlos_gains * self.__sinusoid_normalization,
+                          cos(los_angles), los_phases, float(self.los_doppler_frequency),
+                          los_gains.astype(float))
+
+        return taps
+
+    @staticmethod
+    @jit(nopython=True, fastmath=True, cache=True)
+    def __tap_kernel(taps: np.ndarray,
+                     timestamps: np.ndarray,
+                     nlos_frequencies: np.ndarray,
+                     nlos_phases: np.ndarray,
+                     nlos_doppler: float,
+                     nlos_gains: np.ndarray,
+                     los_frequencies: np.ndarray,
+                     los_phases: np.ndarray,
+                     los_doppler: float,
+                     los_gains: np.ndarray) -> None:
+        """Internal subroutine summing the sinusoids of multiple fading sequence taps.
+
+        Args:
+
+            taps (np.ndarray):
+                Channel gains at requested timestamps, one row per path.
+                Overwritten by this subroutine.
+
+            timestamps (np.ndarray):
+                Time instances at which the channel should be sampled.
+
+            nlos_frequencies (np.ndarray):
+                Normalized doppler frequency of each non-line-of-sight sinusoid, one row per path.
+
+            nlos_phases (np.ndarray):
+                Phase of each non-line-of-sight sinusoid, one row per path.
+
+            nlos_doppler (float):
+                Doppler frequency of the non-line-of-sight components in Hz.
+
+            nlos_gains (np.ndarray):
+                Gain of the non-line-of-sight components for each path,
+                including the normalization by the number of sinusoids.
+
+            los_frequencies (np.ndarray):
+                Normalized doppler frequency of the line-of-sight component for each path.
+
+            los_phases (np.ndarray):
+                Phase of the line-of-sight component for each path.
 
-        los_doppler = self.los_doppler_frequency
-        los_phase = self._rng.uniform(0, 2*pi)
-        los_component = los_gain * exp(1j * (los_doppler * timestamps * cos(los_angle) + los_phase))
-        return los_component + nlos_component
+            los_doppler (float):
+                Doppler frequency of the line-of-sight component in Hz.
+
+            los_gains (np.ndarray):
+                Gain of the line-of-sight component for each path.
+        """
+
+        num_paths, num_sinusoids = nlos_frequencies.shape
+        num_samples = timestamps.shape[0]
+
+        for t in range(num_samples):
+            timestamp = timestamps[t]
+
+            for p in range(num_paths):
+
+                # Accumulate real and imaginary parts separately,
+                # so that each sinusoid requires a single sine-cosine pair instead of a complex exponential
+                nlos_real = 0.
+                nlos_imag = 0.
+                for s in range(num_sinusoids):
+
+                    nlos_phase = nlos_doppler * timestamp * nlos_frequencies[p, s] + nlos_phases[p, s]
+                    nlos_real += np.cos(nlos_phase)
+                    nlos_imag += np.sin(nlos_phase)
+
+                los_phase = los_doppler * timestamp * los_frequencies[p] + los_phases[p]
+                taps[p, t] = complex(los_gains[p] * np.cos(los_phase) + nlos_gains[p] * nlos_real,
+                                     los_gains[p] * np.sin(los_phase) + nlos_gains[p] * nlos_imag)
 
     @property
     def min_sampling_rate(self) -> float:
@@ -437,33 +614,44 @@ class MultipathFadingChannel(Channel):
         # The sampling rate should be chose so that each resolvable path delay falls
         # close to a delay sample
         # ToDo: Check if this equation makes any sense, I might have been a little tired
-        min_rate = (1 - self.delay_resolution_error) / (np.min(np.diff(self.delays)))
+        # Paths sharing a delay do not need to be resolved from each other
+        delay_spacings = np.diff(self.__delays)
+        delay_spacings = delay_spacings[delay_spacings > 0.]
 
-        if min_rate == np.inf:
+        if delay_spacings.size < 1:
             return 0.0
 
-        else:
-            return min_rate
+        return (1 - self.delay_resolution_error) / delay_spacings.min()
 
-    def interpolation_filter(self, sampling_rate: float) -> np.ndarray:
+    def interpolation_filter(self,
+                             sampling_rate: float,
+                             dtype: Type[np.floating] = np.float64) -> np.ndarray:
         """Create an interpolation filter matrix.
 
         Args:
             sampling_rate: The sampling rate to which to interpolate.
+            dtype: Data type of the filter matrix.
 
         Returns:
             np.ndarray:
-                Interpolation filter matrix containing filters for each configured resolvable path.
+                Read-only interpolation filter matrix containing filters for each configured resolvable path.
         """
 
-        num_delay_samples = int(self.__delays[-1] * sampling_rate)
-        filter_instances = np.empty((self.num_resolvable_paths, num_delay_samples+1), float)
-
-        for path_idx, delay in enumerate(self.__delays):
+        # The filter only depends on the delays, which are fixed after initialization
+        cache_key = (sampling_rate, np.dtype(dtype))
+        cached_filter = self.__interpolation_filters.get(cache_key, None)
+        if cached_filter is not None:
+            return cached_filter
 
-            resampling_matrix = delay_resampling_matrix(sampling_rate, 1, delay, num_delay_samples+1)
-            filter_instances[path_idx, :] = resampling_matrix[:, 0] / np.linalg.norm(resampling_matrix)
+        # Sinc interpolation kernels of all paths, each normalized to unit energy
+        num_delay_samples = int(self.__delays[-1] * sampling_rate)
+        filter_instances = np.sinc(np.subtract.outer(self.__delays * sampling_rate, np.arange(num_delay_samples+1)))
+        filter_instances /= np.linalg.norm(filter_instances, axis=1, keepdims=True)
 
+        # Cached filters are shared between calls and must therefore not be modified
+        filter_instances = filter_instances.astype(dtype, copy=False)
+        filter_instances.flags.writeable = False
+        self.__interpolation_filters[cache_key] = filter_instances
         return filter_instances
 
     @classmethod
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 from typing import Optional, List, Any, Type
+import os
 
 import numpy as np
 from oct2py import Oct2Py, Oct2PyError, Struct
@@ -44,23 +45,23 @@ class QuadrigaOctaveInterface(QuadrigaInterface):
         # Init octave session
         self.__octave = Oct2Py()  # executable=octave_bin)
 
-        # Add quadriga source folder to octave lookup paths
+        # Add quadriga source folder and the launch script to octave lookup paths
         self.__octave.addpath(self.path_quadriga_src)
+        self.__octave.addpath(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                           'resources', 'matlab'))
 
     def _run_quadriga(self, **parameters) -> List[Any]:
 
-        # Push parameters to quadriga
-        for key, value in parameters.items():
+        # Numpy arrays are transferred as binary matrices, provided they are contiguous doubles
+        values = [np.ascontiguousarray(value, dtype=float) if isinstance(value, np.ndarray) else value
+                  for value in parameters.values()]
 
-            # Convert numpy arrays to lists
-            if isinstance(value, np.ndarray):
-                value = value.tolist()
-
-            self.__octave.push(key, value)
+        # Push all parameters to quadriga within a single transfer
+        self.__octave.push(list(parameters.keys()), values)
 
         # Launch octave
         try:
-            self.__octave.eval("hermespy/resources/matlab/launch_quadriga_script")
+            self.__octave.eval("launch_quadriga_script")
 
         except Oct2PyError as error:
             raise RuntimeError(error)
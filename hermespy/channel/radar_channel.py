@@ -169,7 +169,8 @@ class RadarChannel(Channel):
 
     def impulse_response(self,
                          num_samples: int,
-                         sampling_rate: float) -> np.ndarray:
+                         sampling_rate: float,
+                         dtype: Type[np.complexfloating] = np.complex128) -> np.ndarray:
 
         # For the radar channel, only channels linking the same device are currently feasible
         if self.transmitter is not self.receiver:
@@ -197,7 +198,7 @@ class RadarChannel(Channel):
         max_delay_in_samples = int(np.ceil(max_delay * self.transmitter.sampling_rate))
 
         impulse_response = np.zeros((num_samples, self.num_outputs, self.num_inputs, max_delay_in_samples),
-                                    dtype=complex)
+                                    dtype=dtype)
 
         # If no target is present we may abort already
         if not self.target_exists:
@@ -15,6 +15,7 @@ from __future__ import annotations
 from typing import Type
 from ruamel.yaml import SafeConstructor, SafeRepresenter, MappingNode
 import numpy as np
+from numba import jit
 
 from hermespy.core.factory import Serializable
 from .coding import Encoder
@@ -59,6 +60,8 @@ class BlockInterleaver(Encoder, Serializable):
     __block_size: int           # The number of bits the interleaver operates on
     __interleave_blocks: int    # The number of sub-blocks the interleaver divides `__block_size` in
 
+    _TILED_BLOCK_SIZE = 1 << 15     # Minimal block size from which on blocks are transposed in cache-sized tiles
+
     def __init__(self,
                  block_size: int,
                  interleave_blocks: int) -> None:
@@ -136,11 +139,63 @@ class BlockInterleaver(Encoder, Serializable):
 
     def encode(self, bits: np.ndarray) -> np.ndarray:
 
-        return bits.reshape((self.interleave_blocks, -1)).T.flatten()
+        # Any integer multiple of the block size is interleaved block-wise by a single transposition
+        section_size = self.block_size // self.interleave_blocks
+        return self.__interleave(bits.reshape((-1, self.interleave_blocks, section_size)))
 
     def decode(self, encoded_bits: np.ndarray) -> np.ndarray:
 
-        return encoded_bits.reshape((-1, self.interleave_blocks)).T.flatten()
+        section_size = self.block_size // self.interleave_blocks
+        return self.__interleave(encoded_bits.reshape((-1, section_size, self.interleave_blocks)))
+
+    def __interleave(self, blocks: np.ndarray) -> np.ndarray:
+        """Transpose a stack of bit matrices.
+
+        Args:
+
+            blocks (np.ndarray):
+                Three-dimensional array of stacked bit matrices.
+
+        Returns:
+            np.ndarray: Vector of the transposed matrices in row-major order.
+        """
+
+        # Small blocks fit into cache anyway, so NumPy's strided copy is faster than the tiled kernel
+        if self.block_size < self._TILED_BLOCK_SIZE:
+            return blocks.transpose((0, 2, 1)).flatten()
+
+        return self.__transpose(np.ascontiguousarray(blocks))
+
+    @staticmethod
+    @jit(nopython=True, cache=True)
+    def __transpose(blocks: np.ndarray) -> np.ndarray:
+        """Internal subroutine transposing a stack of bit matrices.
+
+        The matrices are transposed in square tiles,
+        so that both reads and writes of large blocks stay within cache.
+
+        Args:
+
+            blocks (np.ndarray):
+                Three-dimensional array of `B` stacked `M` x `N` bit matrices.
+
+        Returns:
+            np.ndarray: Vector of the `B` transposed `N` x `M` matrices in row-major order.
+        """
+
+        tile_size = 16
+        num_blocks, num_rows, num_cols = blocks.shape
+        transposed = np.empty((num_blocks, num_cols, num_rows), dtype=blocks.dtype)
+
+        for b in range(num_blocks):
+            for row_tile in range(0, num_rows, tile_size):
+                for col_tile in range(0, num_cols, tile_size):
+
+                    for row in range(row_tile, min(row_tile + tile_size, num_rows)):
+                        for col in range(col_tile, min(col_tile + tile_size, num_cols)):
+                            transposed[b, col, row] = blocks[b, row, col]
+
+        return transposed.reshape(-1)
 
     @property
     def bit_block_size(self) -> int:
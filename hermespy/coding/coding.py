@@ -419,7 +419,6 @@ class EncoderManager(Serializable):
         num_blocks = int(ceil(data_bits.shape[0] / self.bit_block_size))
 
         num_data_bits = num_blocks * bit_block_size
-        num_data_padding_bits = num_data_bits - data_bits.shape[0]
 
         if num_code_bits is None:
 
@@ -434,7 +433,11 @@ class EncoderManager(Serializable):
             if num_code_bits < num_minimal_code_bits:
                 raise ValueError("The requested number of code bits would discard parts for vital recoverability")
 
-        padded_bits = np.concatenate((data_bits, np.zeros(num_data_padding_bits, dtype=int)))
+        # Zero-pad the data bits to full blocks within a single allocation
+        padded_bits = np.empty(num_data_bits, dtype=int)
+        padded_bits[:data_bits.shape[0]] = data_bits
+        padded_bits[data_bits.shape[0]:] = 0
+
         code = np.empty(num_code_bits, dtype=int)
 
         # Iterate over data blocks to be individually encoded
@@ -452,7 +455,7 @@ class EncoderManager(Serializable):
 
         # Pad overall result with zeros if some bits are missing at the end
         if num_code_padding_bits > 0:
-            code[-num_code_padding_bits:] = np.zeros(num_code_padding_bits, dtype=int)
+            code[-num_code_padding_bits:] = 0
 
         # Return resulting overall code
         return code
@@ -486,7 +489,9 @@ class EncoderManager(Serializable):
         if not self.allow_padding and num_padding_bits > 0:
             raise RuntimeError("Padding required but not allowed")
 
-        data_bits = np.append(data_bits, np.zeros(num_padding_bits, dtype=int))
+        if num_padding_bits > 0:
+            data_bits = np.append(data_bits, np.zeros(num_padding_bits, dtype=int))
+
         code_bits = np.empty(num_output_bits, dtype=int)
 
         for b in range(num_blocks):
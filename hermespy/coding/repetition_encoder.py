@@ -12,6 +12,7 @@ from __future__ import annotations
 from typing import Type
 
 import numpy as np
+from numba import jit
 from ruamel.yaml import SafeConstructor, SafeRepresenter, MappingNode
 
 from ..core.factory import Serializable
@@ -87,18 +88,82 @@ class RepetitionEncoder(Encoder, Serializable):
 
     def encode(self, bits: np.ndarray) -> np.ndarray:
 
-        code = np.tile(bits, self.repetitions)
-        return code
+        return self.__encode(bits, self.repetitions)
 
     def decode(self, encoded_bits: np.ndarray) -> np.ndarray:
 
         if self.repetitions == 1:
             return encoded_bits
 
-        code = encoded_bits.reshape((self.repetitions, self.bit_block_size))
-        bits = (np.sum(code, axis=0) / self.repetitions) >= 0.5  # Majority voting
+        if encoded_bits.shape[0] != self.code_block_size:
+            raise ValueError(f"Code block must contain exactly {self.code_block_size} bits "
+                             f"(contains {encoded_bits.shape[0]})")
+
+        return self.__decode(encoded_bits, self.repetitions, self.bit_block_size)
+
+    @staticmethod
+    @jit(nopython=True, cache=True)
+    def __encode(bits: np.ndarray,
+                 repetitions: int) -> np.ndarray:
+        """Internal subroutine to repeat a block of bits.
+
+        Args:
+
+            bits (np.ndarray):
+                Vector of :math:`K_n` bits to be encoded.
+
+            repetitions (int):
+                Number of block repetitions :math:`\\tilde{M}`.
+
+        Returns:
+            np.ndarray: Vector of :math:`L_n` code bits of the same type as `bits`.
+        """
+
+        num_bits = bits.shape[0]
+        code = np.empty(repetitions * num_bits, dtype=bits.dtype)
+
+        for r in range(repetitions):
+            for b in range(num_bits):
+                code[r * num_bits + b] = bits[b]
+
+        return code
+
+    @staticmethod
+    @jit(nopython=True, cache=True)
+    def __decode(code: np.ndarray,
+                 repetitions: int,
+                 bit_block_size: int) -> np.ndarray:
+        """Internal subroutine to majority-vote a block of repeated bits.
 
-        return bits.astype(int)
+        A data bit is decoded as one if the mean of its repeated code values is at least one half,
+        so soft code values are voted by their magnitude.
+
+        Args:
+
+            code (np.ndarray):
+                Vector of :math:`L_n` code bits to be decoded.
+
+            repetitions (int):
+                Number of block repetitions :math:`\\tilde{M}`.
+
+            bit_block_size (int):
+                Number of data bits :math:`K_n`.
+
+        Returns:
+            np.ndarray: Vector of :math:`K_n` decoded data bits.
+        """
+
+        bits = np.empty(bit_block_size, dtype=np.int64)
+
+        for b in range(bit_block_size):
+
+            code_sum = 0.
+            for r in range(repetitions):
+                code_sum += code[r * bit_block_size + b]
+
+            bits[b] = code_sum / repetitions >= .5
+
+        return bits
 
     @property
     def bit_block_size(self) -> int:
@@ -198,3 +263,8 @@ class RepetitionEncoder(Encoder, Serializable):
 
         state = constructor.construct_mapping(node)
         return cls(**state)
+
+
+# Compile the kernels for the integer bit blocks fed by the encoder manager at import,
+# so that the first encoded frame does not pay for the compilation (recalled from numba's disk cache if available)
+_ = RepetitionEncoder().decode(RepetitionEncoder().encode(np.zeros(32, dtype=int)))
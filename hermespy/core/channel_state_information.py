@@ -208,7 +208,7 @@ class ChannelStateInformation:
 
         if self.__state_format == ChannelStateFormat.FREQUENCY_SELECTIVITY:
 
-            self.__state = ifft(self.__state, axis=3)
+            self.__state = ifft(self.__state, axis=3, workers=-1)
             self.__state_format = ChannelStateFormat.IMPULSE_RESPONSE
 
         return self
@@ -238,7 +238,8 @@ class ChannelStateInformation:
             else:
                 self.__num_frequency_bins = num_bins
 
-            self.__state = fft(self.__state, axis=3, n=num_bins)
+            # All antenna pairs and samples are transformed within a single batched FFT
+            self.__state = fft(self.__state, axis=3, n=num_bins, workers=-1)
             self.__state = self.__state.reshape((self.num_receive_streams, self.num_transmit_streams, -1, 1))
 
             self.__state_format = ChannelStateFormat.FREQUENCY_SELECTIVITY
@@ -13,9 +13,11 @@ import datetime
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from enum import Enum
+from functools import lru_cache
 from glob import glob
-from os import getcwd, mkdir
-from typing import ContextManager, List, Optional, Union
+from os import getcwd, mkdir, scandir, stat
+from stat import S_ISDIR
+from typing import Any, ContextManager, Dict, List, Optional, Union
 
 import matplotlib.pyplot as plt
 from rich.console import Console
@@ -77,10 +79,21 @@ class Executable(ABC, Serializable):
 
         # Default parameters
         self.__scenarios = []
+        self.__results_dir = None
         self.results_dir = results_dir
         self.verbosity = verbosity
         self.__console = Console(record=False) if console is None else console
 
+    def __getstate__(self) -> Dict[str, Any]:
+
+        # Rich consoles hold thread locks and may therefore not be pickled
+        return {key: value for key, value in self.__dict__.items() if not isinstance(value, Console)}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+
+        self.__dict__.update(state)
+        self.__console = Console(record=False)
+
     def execute(self) -> None:
         """Execute the executable.
 
@@ -116,14 +129,19 @@ class Executable(ABC, Serializable):
             ValueError: If `directory` does not exist within the filesystem.
         """
 
-        if directory is None:
-            self.__results_dir = None
+        # Directories are validated once, re-assigning the current directory requires no filesystem access
+        if directory is None or directory == self.__results_dir:
+            self.__results_dir = directory
             return
 
-        if not path.exists(directory):
+        # A single stat call both checks the existence and the type of the directory
+        try:
+            directory_mode = stat(directory).st_mode
+
+        except FileNotFoundError:
             raise ValueError("The provided results directory does not exist")
 
-        if not path.isdir(directory):
+        if not S_ISDIR(directory_mode):
             raise ValueError("The provided results directory path is not a directory")
 
         self.__results_dir = directory
@@ -162,8 +180,7 @@ class Executable(ABC, Serializable):
         """
 
         today = str(datetime.date.today())
-
-        dir_index = 0
+        prefix = today + '_'
 
         base_directory = path.join(getcwd(), "results")
 
@@ -171,12 +188,12 @@ class Executable(ABC, Serializable):
         if not path.exists(base_directory):
             mkdir(base_directory)
 
-        results_dir = path.join(base_directory, today + '_' + '{:03d}'.format(dir_index))
-
-        while path.exists(results_dir):
+        # Infer the next free index from a single scan of the existing results directories of today
+        with scandir(base_directory) as entries:
+            dir_index = 1 + max((int(entry.name[len(prefix):]) for entry in entries
+                                 if entry.name.startswith(prefix) and entry.name[len(prefix):].isdigit()), default=-1)
 
-            dir_index += 1
-            results_dir = path.join(base_directory, today + '_' + '{:03d}'.format(dir_index))
+        results_dir = path.join(base_directory, prefix + '{:03d}'.format(dir_index))
 
         # Create the results directory
         mkdir(results_dir)
@@ -214,6 +231,7 @@ class Executable(ABC, Serializable):
         raise ValueError("Requested style identifier not available")
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def __hermes_styles() -> List[str]:
         """Styles available in Hermes only.
 
@@ -242,6 +260,7 @@ class Executable(ABC, Serializable):
             yield plt.style.use(Executable.__style)
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def __hermes_root_dir() -> str:
         """HermesPy Package Root Directory.
 
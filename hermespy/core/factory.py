@@ -219,7 +219,7 @@ class Factory:
     def __init__(self) -> None:
 
         # YAML dumper configuration
-        self.__yaml = YAML(typ='safe', pure=True)
+        self.__yaml = YAML(typ='safe', pure=False)
         self.__yaml.default_flow_style = False
         self.__yaml.compact(seq_seq=False, seq_map=False)
         self.__yaml.encoding = None
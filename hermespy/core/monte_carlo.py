@@ -106,6 +106,7 @@ from warnings import catch_warnings, simplefilter
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 import numpy as np
+from numpy.random import SeedSequence
 import ray
 from ray.util import ActorPool
 from rich.console import Console, Group
@@ -117,6 +118,7 @@ from scipy.io import savemat
 from scipy.stats import norm
 
 from .executable import Executable
+from .random_node import RandomNode
 
 __author__ = "Jan Adler"
 __copyright__ = "Copyright 2022, Barkhausen Institut gGmbH"
@@ -678,7 +680,8 @@ class MonteCarloActor(Generic[MO]):
     __section_block_size: int = 10                  # Number of samples per section block
 
     def __init__(self,
-                 argument_tuple: Tuple[MO, List[GridDimension], List[Evaluator[MO]]],
+                 argument_tuple: Union[Tuple[MO, List[GridDimension], List[Evaluator[MO]]],
+                                       Tuple[MO, List[GridDimension], List[Evaluator[MO]], Optional[int]]],
                  section_block_size: int = 10) -> None:
         """
         Args:
@@ -687,6 +690,8 @@ class MonteCarloActor(Generic[MO]):
                 Object to be investigated during the simulation runtime.
                 Dimensions over which the simulation will iterate.
                 Evaluators used to process the investigated object sample state.
+                Optional seed re-initializing the investigated object's random number generator,
+                so that each actor samples an independent random stream.
 
             section_block_size (int):
                 Number of samples generated per section block.
@@ -695,8 +700,14 @@ class MonteCarloActor(Generic[MO]):
         investigated_object = argument_tuple[0]
         grid = argument_tuple[1]
         evaluators = argument_tuple[2]
+        seed = argument_tuple[3] if len(argument_tuple) > 3 else None
         self.__section_block_size = section_block_size
 
+        # Actors receive identical copies of the investigated object,
+        # so the random streams would be identical without re-seeding
+        if seed is not None and isinstance(investigated_object, RandomNode):
+            investigated_object.set_seed(seed)
+
         self.__investigated_object = investigated_object  # deepcopy(investigated_object)
         self.__grid = grid
         self.__evaluators = evaluators
@@ -1242,8 +1253,9 @@ class MonteCarlo(Generic[MO]):
         with self.console.status("Launching Actor Pool...", spinner='dots'):
 
             # Generate the actor pool
-            actor_pool = ActorPool([actor.remote((self.__investigated_object, self.__dimensions, self.__evaluators))
-                                    for _ in range(self.__num_actors)])
+            actor_pool = ActorPool([actor.remote((self.__investigated_object, self.__dimensions,
+                                                  self.__evaluators, seed))
+                                    for seed in self.__actor_seeds()])
 
             # Generate section sample containers and meta-information
             grid_task_count = np.zeros([dimension.num_sample_points for dimension in self.__dimensions], dtype=int)
@@ -1386,6 +1398,21 @@ class MonteCarlo(Generic[MO]):
 
         return section_coordinates, num_processed_samples
 
+    def __actor_seeds(self) -> List[int]:
+        """Spawn an independent random seed for each actor.
+
+        The seeds are derived from the investigated object's random number generator,
+        so that seeded simulations remain reproducible.
+
+        Returns:
+            List[int]: One seed per actor.
+        """
+
+        entropy = self.__investigated_object._rng.integers(0, 2 ** 63) \
+            if isinstance(self.__investigated_object, RandomNode) else None
+
+        return [int(seed.generate_state(1, np.uint64)[0]) for seed in SeedSequence(entropy).spawn(self.__num_actors)]
+
     def __queue_next(self,
                      pool: ActorPool,
                      grid: np.ndarray,
@@ -50,6 +50,7 @@ class RandomNode(object):
 
         self.__generator = default_rng(seed)
         self.__mother_node = mother_node
+        self.__seed = seed
 
     @property
     def _rng(self) -> Generator:
@@ -77,6 +78,16 @@ class RandomNode(object):
 
         return self.__generator is not None
 
+    @property
+    def seed(self) -> Optional[int]:
+        """Seed the pseudo-random number generator was initialized with.
+
+        Returns:
+            Optional[int]: The configured seed. `None` if the generator was initialized from fresh entropy.
+        """
+
+        return self.__seed
+
     def set_seed(self, seed: int) -> None:
         """Set an initialization seed for the pseudo-random number generator.
 
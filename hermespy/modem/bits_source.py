@@ -25,8 +25,7 @@ There are currently two basic types of bit sources available:
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from math import ceil
-from typing import BinaryIO, Optional
+from typing import Any, BinaryIO, Optional, Tuple
 
 import numpy as np
 
@@ -69,13 +68,34 @@ class BitsSource(ABC, RandomNode):
 
         Returns:
             np.ndarray:
-                A numpy vector of `num_bits` generated bits.
+                A numpy `uint8` vector of `num_bits` generated bits.
         """
         ...
 
+    def generate_bits_batched(self, shape: Tuple[int, ...]) -> np.ndarray:
+        """Generate multiple sequences of bits at once.
+
+        Args:
+
+            shape (Tuple[int, ...]):
+                Shape of the generated bit tensor, for example the number of frames and bits per frame.
+
+        Returns:
+            np.ndarray:
+                A numpy `uint8` tensor of generated bits of dimensions `shape`.
+                Bits are generated in row-major order, i.e. consecutive sequences are stored along the first axis.
+        """
+
+        return self.generate_bits(int(np.prod(shape))).reshape(shape)
+
 
 class RandomBitsSource(BitsSource, Serializable):
-    """Bit stream generator for pseudo-random sequences of bits."""
+    """Bit stream generator for pseudo-random sequences of bits.
+
+    Bits are taken directly from the raw 64-bit output of the random node's bit generator.
+    Seeded bit sequences therefore only depend on the bit generator's state,
+    but differ from sequences drawn by bounded integer sampling of earlier versions.
+    """
 
     yaml_tag = u'RandomBits'
 
@@ -92,13 +112,25 @@ class RandomBitsSource(BitsSource, Serializable):
 
     def generate_bits(self, num_bits: int) -> np.ndarray:
 
-        return self._rng.integers(0, 2, size=num_bits, dtype=int)
+        # Each raw 64-bit draw of the underlying bit generator provides 64 random bits at once
+        raw_draws = self._rng.bit_generator.random_raw(size=(num_bits + 63) // 64)
+        return np.unpackbits(raw_draws.view(np.uint8), count=num_bits)
 
 
 class StreamBitsSource(BitsSource, Serializable):
-    """Bit-stream generator mapping representing file system streams as bit sources."""
+    """Bit-stream generator mapping representing file system streams as bit sources.
+
+    The bits of each byte read from the stream are generated most significant bit first,
+    which is the bit order the symbol mappers expect when combining consecutive bits to symbol indices.
+
+    Attributes:
+
+        __stream (BinaryIO): Buffered stream the bits are read from.
+        __residual_bits (np.ndarray): Bits read from the stream but not yet generated.
+    """
 
     __stream: BinaryIO
+    __residual_bits: np.ndarray
 
     def __init__(self,
                  path: str) -> None:
@@ -110,21 +142,44 @@ class StreamBitsSource(BitsSource, Serializable):
         """
 
         BitsSource.__init__(self)
-        self.__stream = open(path, mode='rb')
+        self.__stream = open(path, mode='rb', buffering=1 << 20)
+        self.__residual_bits = np.empty(0, dtype=np.uint8)
 
     def __del__(self) -> None:
 
+        self.close()
+
+    def __enter__(self) -> StreamBitsSource:
+
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying stream.
+
+        Closing an already closed source has no effect.
+        """
+
         self.__stream.close()
 
     def generate_bits(self, num_bits: int) -> np.ndarray:
 
-        num_bytes = int(ceil(num_bits / 8))
-        bit_overflow = num_bytes * 8 - num_bits
+        # Serve as many bits as possible from the remainder of previous reads
+        num_residual_bits = min(num_bits, len(self.__residual_bits))
+        residual_bits = self.__residual_bits[:num_residual_bits]
+        self.__residual_bits = self.__residual_bits[num_residual_bits:]
 
-        if bit_overflow > 0:
-            raise RuntimeError("Bit caching not yet supported")
+        num_missing_bits = num_bits - num_residual_bits
+        if num_missing_bits < 1:
+            return residual_bits
 
+        # Read whole bytes from the stream and keep the surplus bits for the next generation
+        num_bytes = (num_missing_bits + 7) // 8
         byte_string = self.__stream.read(num_bytes)
-        array = np.unpackbits(np.frombuffer(byte_string, dtype=np.uint8))
+        read_bits = np.unpackbits(np.frombuffer(byte_string, dtype=np.uint8))
 
-        return array
+        self.__residual_bits = read_bits[num_missing_bits:]
+        return np.concatenate((residual_bits, read_bits[:num_missing_bits]))
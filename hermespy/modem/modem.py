@@ -433,7 +433,7 @@ class Modem(RandomNode, DuplexOperator, SerializableArray):
 
         # Demodulate the parallel frames arriving at each stream,
         # then decode the (inverse) precoding over all stream frames
-        decoded_symbols = np.empty(0, dtype=complex)
+        decoded_frame_symbols: List[np.ndarray] = []
         for frame_streams in frames.transpose(1, 0, 2):
 
             # Demodulate each frame separately
@@ -455,13 +455,12 @@ class Modem(RandomNode, DuplexOperator, SerializableArray):
                                                                        ChannelStateDimension.RECEIVE_STREAMS)
             frame_noises = np.array(noises, dtype=float)
 
-            decoded_frame_symbols = self.precoding.decode(frame_symbols,
-                                                          frame_channel_states,
-                                                          frame_noises)
-            decoded_symbols = np.append(decoded_symbols, decoded_frame_symbols)
+            decoded_frame_symbols.append(self.precoding.decode(frame_symbols,
+                                                               frame_channel_states,
+                                                               frame_noises).flatten())
 
         # Convert decoded symbols to from array to symbols
-        decoded_symbols = Symbols(decoded_symbols)
+        decoded_symbols = Symbols(np.concatenate(decoded_frame_symbols).astype(complex, copy=False))
 
         # Map the symbols to code bits
         code_bits = self.waveform_generator.unmap(decoded_symbols)
@@ -115,6 +115,9 @@ class PskQamMapping(object):
 
         self.soft_output = soft_output
 
+        self.__table = None
+        self.__table_configuration = None
+
     def get_symbols(self, bits: np.ndarray) -> np.ndarray:
         """Calculates the complex numbers corresponding to the information in 'bits'.
 
@@ -131,65 +134,111 @@ class PskQamMapping(object):
                 Vector of N/log2(modulation_order) elements with modulated symbols.
         """
         number_symbols = int(bits.size / self.bits_per_symbol)
-        # bits in rows, symbols in columns
-        bits = np.reshape(
-            bits, (self.bits_per_symbol, number_symbols), order='F')
+
+        # bits of each symbol in rows, the first bit being the MSB of the symbol's constellation index
+        bits = np.reshape(bits, (number_symbols, self.bits_per_symbol))
+
+        symbol_indices = bits[:, 0].astype(np.intp)
+        for bit_idx in range(1, self.bits_per_symbol):
+
+            symbol_indices <<= 1
+            np.add(symbol_indices, bits[:, bit_idx], out=symbol_indices, casting='unsafe')
+
+        return self.__symbol_table()[symbol_indices]
+
+    def __symbol_table(self) -> np.ndarray:
+        """Constellation lookup table.
+
+        The table is computed once and only recomputed if the constellation configuration changed.
+
+        Returns:
+            np.ndarray:
+                Vector of `modulation_order` symbols,
+                indexed by the integer value of their bits.
+        """
+
+        if self.__table is not None and self.__table_configuration[0] == self.modulation_order and \
+                self.__table_configuration[1] == self.is_complex and self.__table_configuration[2] is self.mapping:
+            return self.__table
 
         if self.mapping is not None:
-            # e.g. [8, 4, 2, 1]
-            power_of_2 = 2 ** np.arange(self.bits_per_symbol - 1, -1, -1)
-            idx = np.matmul(power_of_2, bits)  # multiply to get symbol value
-            symbols = self.mapping[idx]
+            table = self.mapping
+
+        else:
+
+            # Map all possible bit combinations, bits in rows and symbols in columns
+            bits = (np.arange(self.modulation_order)[np.newaxis, :] >>
+                    np.arange(self.bits_per_symbol - 1, -1, -1)[:, np.newaxis]) & 1
+            table = np.ravel(self.__map_3gpp(bits))
+
+        self.__table = table
+        self.__table_configuration = (self.modulation_order, self.is_complex, self.mapping)
+
+        return table
+
+    def __map_3gpp(self, bits: np.ndarray) -> np.ndarray:
+        """Map bits to symbols following the 3GPP constellations.
+
+        Args:
+            bits (np.ndarray):
+                Integer matrix of bits, with the bits of each symbol in columns.
 
+        Returns:
+            np.ndarray:
+                Vector of modulated symbols.
+
+        Raises:
+            ValueError: If no 3GPP mapping is defined for the modulation.
+        """
+
+        # use 3GPP mapping for BPSK, QPSK, 16-,64- and 256-QAM (or PAM
+        # equivalent)
+        if self.modulation_order == 2:
+            # BPSK
+            symbols = self.generate_pam_symbol_3gpp(2, bits) + 1j * 0
+        elif self.modulation_order == 4 and self.is_complex:
+            # QPSK
+            real_part = self.generate_pam_symbol_3gpp(2, bits[0, :])
+            imag_part = self.generate_pam_symbol_3gpp(2, bits[1, :])
+            symbols = (real_part + 1j * imag_part) / np.sqrt(2)
+        elif self.modulation_order == 4 and not self.is_complex:
+            # 4-PAM
+            symbols = self.generate_pam_symbol_3gpp(
+                4, bits) / np.sqrt(5) + 1j * 0
+        elif self.modulation_order == 8 and not self.is_complex:
+            # 8-PAM
+            symbols = self.generate_pam_symbol_3gpp(
+                8, bits) / np.sqrt(21) + 1j * 0
+        elif self.modulation_order == 16 and self.is_complex:
+            # 16-QAM
+            real_part = self.generate_pam_symbol_3gpp(4, bits[[0, 2], :])
+            imag_part = self.generate_pam_symbol_3gpp(4, bits[[1, 3], :])
+            symbols = (real_part + 1j * imag_part) / np.sqrt(10)
+        elif self.modulation_order == 16 and not self.is_complex:
+            # 16-PAM
+            symbols = self.generate_pam_symbol_3gpp(
+                16, bits) / np.sqrt(85) + 1j * 0
+        elif self.modulation_order == 64 and self.is_complex:
+            real_part = self.generate_pam_symbol_3gpp(
+                8, bits[[0, 2, 4], :])
+            imag_part = self.generate_pam_symbol_3gpp(
+                8, bits[[1, 3, 5], :])
+            symbols = (real_part + 1j * imag_part) / np.sqrt(42)
+        elif self.modulation_order == 256 and self.is_complex:
+            real_part = self.generate_pam_symbol_3gpp(
+                16, bits[[0, 2, 4, 6], :])
+            imag_part = self.generate_pam_symbol_3gpp(
+                16, bits[[1, 3, 5, 7], :])
+            symbols = (real_part + 1j * imag_part) / np.sqrt(170)
         else:
-            # use 3GPP mapping for BPSK, QPSK, 16-,64- and 256-QAM (or PAM
-            # equivalent)
-            if self.modulation_order == 2:
-                # BPSK
-                symbols = self.generate_pam_symbol_3gpp(2, bits) + 1j * 0
-            elif self.modulation_order == 4 and self.is_complex:
-                # QPSK
-                real_part = self.generate_pam_symbol_3gpp(2, bits[0, :])
-                imag_part = self.generate_pam_symbol_3gpp(2, bits[1, :])
-                symbols = (real_part + 1j * imag_part) / np.sqrt(2)
-            elif self.modulation_order == 4 and not self.is_complex:
-                # 4-PAM
-                symbols = self.generate_pam_symbol_3gpp(
-                    4, bits) / np.sqrt(5) + 1j * 0
-            elif self.modulation_order == 8 and not self.is_complex:
-                # 8-PAM
-                symbols = self.generate_pam_symbol_3gpp(
-                    8, bits) / np.sqrt(21) + 1j * 0
-            elif self.modulation_order == 16 and self.is_complex:
-                # 16-QAM
-                real_part = self.generate_pam_symbol_3gpp(4, bits[[0, 2], :])
-                imag_part = self.generate_pam_symbol_3gpp(4, bits[[1, 3], :])
-                symbols = (real_part + 1j * imag_part) / np.sqrt(10)
-            elif self.modulation_order == 16 and not self.is_complex:
-                # 16-PAM
-                symbols = self.generate_pam_symbol_3gpp(
-                    16, bits) / np.sqrt(85) + 1j * 0
-            elif self.modulation_order == 64 and self.is_complex:
-                real_part = self.generate_pam_symbol_3gpp(
-                    8, bits[[0, 2, 4], :])
-                imag_part = self.generate_pam_symbol_3gpp(
-                    8, bits[[1, 3, 5], :])
-                symbols = (real_part + 1j * imag_part) / np.sqrt(42)
-            elif self.modulation_order == 256 and self.is_complex:
-                real_part = self.generate_pam_symbol_3gpp(
-                    16, bits[[0, 2, 4, 6], :])
-                imag_part = self.generate_pam_symbol_3gpp(
-                    16, bits[[1, 3, 5, 7], :])
-                symbols = (real_part + 1j * imag_part) / np.sqrt(170)
+            if self.is_complex:
+                modulation_type = 'QAM'
             else:
-                if self.is_complex:
-                    modulation_type = 'QAM'
-                else:
-                    modulation_type = 'PAM'
-                raise ValueError(
-                    f"Modulation ({self.modulation_order}-{modulation_type}) not supported")
+                modulation_type = 'PAM'
+            raise ValueError(
+                f"Modulation ({self.modulation_order}-{modulation_type}) not supported")
 
-        return np.ravel(symbols)
+        return symbols
 
     def detect_bits(self,
                     rx_symbols: np.ndarray,
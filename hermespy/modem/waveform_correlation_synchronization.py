@@ -6,10 +6,11 @@ Correlation-Based Waveform Synchronization
 """
 
 from __future__ import annotations
-from typing import Any, Generic, List, Tuple, TypeVar
+from typing import Any, Generic, List, Optional, Tuple, TypeVar
 
 import numpy as np
-from scipy.signal import correlate, find_peaks
+from scipy.fft import fft, ifft, next_fast_len
+from scipy.signal import find_peaks
 
 from ..core.channel_state_information import ChannelStateInformation
 from .waveform_generator import PilotWaveformGenerator, Synchronization
@@ -33,6 +34,7 @@ class CorrelationSynchronization(Generic[PGT], Synchronization[PGT]):
 
     __threshold: float          # Correlation threshold at which a pilot signal is detected
     __guard_ratio: float        # Guard ratio of frame duration
+    __pilot_spectrum: Optional[Tuple[np.ndarray, int, np.ndarray]]    # Cached pilot, FFT size and pilot spectrum
 
     def __init__(self,
                  threshold: float = 0.9,
@@ -54,6 +56,7 @@ class CorrelationSynchronization(Generic[PGT], Synchronization[PGT]):
 
         self.threshold = threshold
         self.guard_ratio = guard_ratio
+        self.__pilot_spectrum = None
 
         Synchronization.__init__(self, *args, **kwargs)
 
@@ -115,8 +118,12 @@ class CorrelationSynchronization(Generic[PGT], Synchronization[PGT]):
         if len(pilot_sequence) < 1:
             raise RuntimeError("No pilot sequence configured, time-domain correlation synchronization impossible")
 
-        correlation = correlate(signal, pilot_sequence, mode='full', method='fft')
-        correlation /= (np.linalg.norm(pilot_sequence) ** 2)  # Normalize correlation
+        # Correlate in frequency domain, the full correlation's negative lags wrap around to the end
+        num_pilot_samples = len(pilot_sequence)
+        fft_size = next_fast_len(len(signal) + num_pilot_samples - 1)
+        circular_correlation = ifft(fft(signal, fft_size) * self.__conjugate_pilot_spectrum(pilot_sequence, fft_size))
+        correlation = np.concatenate((circular_correlation[fft_size - num_pilot_samples + 1:],
+                                      circular_correlation[:len(signal)]))
 
         # Determine the pilot sequence locations by performing a peak search over the correlation profile
         frame_length = self.waveform_generator.samples_in_frame
@@ -142,3 +149,41 @@ class CorrelationSynchronization(Generic[PGT], Synchronization[PGT]):
                 frames.append((signal_frame, csi_frame))
 
         return frames
+
+    def synchronize_stack(self,
+                          signal: np.ndarray,
+                          channel_state: ChannelStateInformation) -> Tuple[np.ndarray, np.ndarray]:
+
+        # Detected frames are not equidistant, so they are gathered from the correlation-based synchronization
+        frames = self.synchronize(signal, channel_state)
+        return self._stack_frames(frames, self.waveform_generator.samples_in_frame, channel_state)
+
+    def __conjugate_pilot_spectrum(self,
+                                   pilot_sequence: np.ndarray,
+                                   fft_size: int) -> np.ndarray:
+        """Normalized and conjugated pilot spectrum.
+
+        The spectrum is cached, since the pilot sequence usually remains constant over many synchronized frames.
+
+        Args:
+
+            pilot_sequence (np.ndarray):
+                Pilot samples.
+
+            fft_size (int):
+                Number of frequency bins.
+
+        Returns:
+            np.ndarray: Conjugate spectrum of `pilot_sequence` normalized to unit correlation peak.
+        """
+
+        if self.__pilot_spectrum is not None:
+
+            cached_pilot, cached_fft_size, spectrum = self.__pilot_spectrum
+            if cached_fft_size == fft_size and np.array_equal(cached_pilot, pilot_sequence):
+                return spectrum
+
+        spectrum = fft(pilot_sequence, fft_size).conj() / np.linalg.norm(pilot_sequence) ** 2
+        self.__pilot_spectrum = (pilot_sequence, fft_size, spectrum)
+
+        return spectrum
@@ -7,7 +7,6 @@ Communication Waveform Base
 
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from math import floor
 from typing import Generic, Tuple, TYPE_CHECKING, Optional, Type, TypeVar, List
 
 import numpy as np
@@ -100,6 +99,113 @@ class Synchronization(Generic[WaveformType], ABC):
                 If the synchronization routine is floating
         """
 
+        self.__validate(signal, channel_state)
+
+        samples_per_frame = self.__waveform_generator.samples_in_frame
+        num_frames = len(signal) // samples_per_frame
+
+        # Slice signals and channel state information into frame-sized portions
+        # Default synchronization does NOT account for possible delays,
+        # i.e. assume the the first base-band signal's sample to also be the first frame's initial sample
+        frame_samples = signal[:num_frames*samples_per_frame].reshape((num_frames, samples_per_frame))
+
+        # The channel state may lack the trailing delay samples, so its last frame might be truncated.
+        # All complete frames are views into a single reshape of the channel state
+        state = channel_state.state
+        num_state_frames = min(num_frames, state.shape[2] // samples_per_frame)
+        state_frames = state[:, :, :num_state_frames*samples_per_frame, :].reshape((state.shape[0], state.shape[1],
+                                                                                   num_state_frames, samples_per_frame,
+                                                                                   state.shape[3]))
+
+        state_format = channel_state.state_format
+        num_delay_taps = channel_state.num_delay_taps
+        frame_channel_states = [ChannelStateInformation(state_format, state_frames[:, :, f, :, :], num_delay_taps)
+                                for f in range(num_state_frames)]
+        frame_channel_states += [channel_state[:, :, f*samples_per_frame:(1+f)*samples_per_frame, :]
+                                 for f in range(num_state_frames, num_frames)]
+
+        synchronized_frames: List[Tuple[np.ndarray, ChannelStateInformation]] = list(zip(frame_samples,
+                                                                                        frame_channel_states))
+        return synchronized_frames
+
+    def synchronize_stack(self,
+                          signal: np.ndarray,
+                          channel_state: ChannelStateInformation) -> Tuple[np.ndarray, np.ndarray]:
+        """Simulates time-synchronization at the receiver-side, stacking all frames into single tensors.
+
+        Sorts base-band signal-sections into frames in time-domain, just like :meth:`.synchronize`.
+        Instead of a list of frames, the samples and channel states of all frames are returned as stacked tensors,
+        so that they may be processed as a batch.
+
+        Args:
+
+            signal (np.ndarray):
+                Vector of complex base-band samples of a single input stream with `num_samples` entries.
+
+            channel_state (ChannelStateInformation):
+                State of the wireless transmission channel over which `signal` has been propagated.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]:
+                Matrix of frame samples of dimension `num_frames`x`samples_in_frame` and
+                channel state tensor of dimension
+                `num_receive_streams`x`num_transmit_streams`x`num_frames`x`samples_in_frame`x`state_information`.
+                Frame sections not covered by `channel_state` are zero.
+
+        Raises:
+
+            ValueError:
+                If the number of received streams in `channel_state` does not equal one.
+                If the length of `signal` and the number of samples in `channel_state` are not identical.
+
+            RuntimeError:
+                If the synchronization routine is floating
+        """
+
+        self.__validate(signal, channel_state)
+
+        samples_per_frame = self.__waveform_generator.samples_in_frame
+        num_frames = len(signal) // samples_per_frame
+        num_frame_samples = num_frames * samples_per_frame
+
+        frame_samples = signal[:num_frame_samples].reshape((num_frames, samples_per_frame))
+
+        # The channel state stack is a view if the state covers all frames, otherwise the missing tail is zero-padded
+        state = channel_state.state
+        if state.shape[2] < num_frame_samples:
+
+            padded_state = np.zeros((state.shape[0], state.shape[1], num_frame_samples, state.shape[3]),
+                                    dtype=state.dtype)
+            padded_state[:, :, :state.shape[2], :] = state
+            state = padded_state
+
+        state_frames = state[:, :, :num_frame_samples, :].reshape((state.shape[0], state.shape[1], num_frames,
+                                                                   samples_per_frame, state.shape[3]))
+        return frame_samples, state_frames
+
+    def __validate(self,
+                   signal: np.ndarray,
+                   channel_state: ChannelStateInformation) -> None:
+        """Validate the arguments of the default synchronization routines.
+
+        Args:
+
+            signal (np.ndarray):
+                Vector of complex base-band samples of a single input stream with `num_samples` entries.
+
+            channel_state (ChannelStateInformation):
+                State of the wireless transmission channel over which `signal` has been propagated.
+
+        Raises:
+
+            ValueError:
+                If the number of received streams in `channel_state` does not equal one.
+                If the length of `signal` and the number of samples in `channel_state` are not identical.
+
+            RuntimeError:
+                If the synchronization routine is floating
+        """
+
         if self.__waveform_generator is None:
             raise RuntimeError("Trying to synchronize with a floating synchronization routine")
 
@@ -109,20 +215,39 @@ class Synchronization(Generic[WaveformType], ABC):
         if channel_state.num_receive_streams != 1:
             raise ValueError("Channel state during synchronization may only contain a single receive stream")
 
-        samples_per_frame = self.__waveform_generator.samples_in_frame
-        num_frames = int(floor(len(signal) / samples_per_frame))
+    @staticmethod
+    def _stack_frames(frames: List[Tuple[np.ndarray, ChannelStateInformation]],
+                      samples_per_frame: int,
+                      channel_state: ChannelStateInformation) -> Tuple[np.ndarray, np.ndarray]:
+        """Stack a list of synchronized frames into single tensors.
 
-        # Slice signals and channel state information into frame-sized portions
-        # Default synchronization does NOT account for possible delays,
-        # i.e. assume the the first base-band signal's sample to also be the first frame's initial sample
-        synchronized_frames: List[Tuple[np.ndarray, ChannelStateInformation]] = []
-        for frame_idx in range(num_frames):
+        Args:
 
-            frame_samples = signal[frame_idx*samples_per_frame:(1+frame_idx)*samples_per_frame]
-            frame_channel_state = channel_state[:, :,  frame_idx*samples_per_frame:(1+frame_idx)*samples_per_frame, :]
-            synchronized_frames.append((frame_samples, frame_channel_state))
+            frames (List[Tuple[np.ndarray, ChannelStateInformation]]):
+                Synchronized frames, as returned by :meth:`.synchronize`.
 
-        return synchronized_frames
+            samples_per_frame (int):
+                Number of samples within each frame.
+
+            channel_state (ChannelStateInformation):
+                Channel state the `frames` have been sliced from.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]:
+                Stacked frame samples and channel states, see :meth:`.synchronize_stack`.
+        """
+
+        state = channel_state.state
+        frame_samples = np.zeros((len(frames), samples_per_frame), dtype=complex)
+        state_frames = np.zeros((state.shape[0], state.shape[1], len(frames), samples_per_frame, state.shape[3]),
+                                dtype=state.dtype)
+
+        for f, (signal_frame, csi_frame) in enumerate(frames):
+
+            frame_samples[f, :len(signal_frame)] = signal_frame
+            state_frames[:, :, f, :csi_frame.num_samples, :] = csi_frame.state
+
+        return frame_samples, state_frames
 
 
 class ChannelEstimation(Generic[WaveformType], ABC):
@@ -256,6 +381,7 @@ class WaveformGenerator(ABC):
     __channel_equalization: ChannelEqualization     # Channel equalization routine
     __oversampling_factor: int                      # Oversampling factor
     __modulation_order: int                         # Cardinality of the set of communication symbols
+    __bits_per_symbol: int                          # Number of bits encoded by each communication symbol
 
     def __init__(self,
                  modem: Optional[Modem] = None,
@@ -364,6 +490,9 @@ class WaveformGenerator(ABC):
 
         self.__modulation_order = order
 
+        # The order is a power of two, so its binary logarithm is the position of its single set bit
+        self.__bits_per_symbol = int(order).bit_length() - 1
+
     @property
     def bits_per_symbol(self) -> int:
         """Number of bits transmitted per modulated symbol.
@@ -372,7 +501,7 @@ class WaveformGenerator(ABC):
             int: Number of bits per symbol
         """
 
-        return int(np.log2(self.__modulation_order))
+        return self.__bits_per_symbol
 
     @property
     @abstractmethod
@@ -346,17 +346,6 @@ class WaveformGeneratorChirpFsk(PilotWaveformGenerator, Serializable):
 
         self.__guard_interval = interval
 
-    @property
-    def bits_per_symbol(self) -> int:
-        """The number of bits per generated symbol.
-
-        Returns:
-            int:
-                The number of bits.
-        """
-
-        return int(np.log2(self.modulation_order))
-
     @property
     def bits_per_frame(self) -> int:
 
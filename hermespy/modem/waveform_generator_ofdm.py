@@ -332,6 +332,8 @@ class FrameSymbolSection(FrameSection, Serializable):
 
     yaml_tag: str = u'Symbol'
     pattern: List[int]
+    __resource_mask: Optional[np.ndarray]   # Cached resource mask
+    __resource_mask_key: Optional[Tuple]    # Frame configuration the cached resource mask was built for
 
     def __init__(self,
                  num_repetitions: int = 1,
@@ -342,6 +344,9 @@ class FrameSymbolSection(FrameSection, Serializable):
         self.pattern = pattern if pattern is not None else []
         self.frame = frame
 
+        self.__resource_mask = None
+        self.__resource_mask_key = None
+
     @property
     def num_symbols(self) -> int:
 
@@ -398,10 +403,13 @@ class FrameSymbolSection(FrameSection, Serializable):
 
         # By convention, the length of each time slot is the inverse of the sub-carrier spacing
         num_slot_samples = self.frame.num_subcarriers * self.frame.oversampling_factor
-        resource_signals = ifft(grid, n=num_slot_samples, axis=0, norm='ortho')
+        resource_signals = ifft(grid, n=num_slot_samples, axis=0, norm='ortho', workers=-1)
+
+        # Add the cyclic prefix to each time slot while simultaneously flatten the resource signals into time domain,
+        # writing prefixes and slots directly into the section's signal
+        signal_samples = np.empty(self.num_samples, dtype=complex)
+        sample_index = 0
 
-        # Add the cyclic prefix to each time slot while simultaneously flatten the resource signals into time domain
-        signals = []
         for resource_idx, resource_samples in enumerate(resource_signals.T):
 
             pattern_idx = resource_idx % len(self.pattern)
@@ -410,11 +418,13 @@ class FrameSymbolSection(FrameSection, Serializable):
             num_prefix_samples = int(num_slot_samples * cp_ratio)
 
             if num_prefix_samples > 0:
-                signals.append(resource_samples[-num_prefix_samples:])
 
-            signals.append(resource_samples)
+                signal_samples[sample_index:sample_index+num_prefix_samples] = resource_samples[-num_prefix_samples:]
+                sample_index += num_prefix_samples
+
+            signal_samples[sample_index:sample_index+num_slot_samples] = resource_samples
+            sample_index += num_slot_samples
 
-        signal_samples = np.concatenate(signals, axis=0)
         return signal_samples
 
     def demodulate(self,
@@ -424,45 +434,51 @@ class FrameSymbolSection(FrameSection, Serializable):
         samples_per_slot = self.frame.num_subcarriers * self.frame.oversampling_factor
 
         # Remove the cyclic prefixes before transformation into time-domain
-        sample_index = 0
-        sample_indices = np.empty(0, dtype=int)
-        channel_sample_indices = np.empty(0, dtype=int)
         num_slots = len(self.pattern) * self.num_repetitions
+        num_prefix_samples = np.array([int(samples_per_slot * self.frame.resources[resource_idx].cp_ratio)
+                                       for resource_idx in self.pattern] * self.num_repetitions, dtype=int)
 
-        for slot_idx in range(num_slots):
-
-            pattern_idx = slot_idx % len(self.pattern)
-            resource = self.frame.resources[self.pattern[pattern_idx]]
-
-            num_prefix_samples = int(samples_per_slot * resource.cp_ratio)
-            sample_index += num_prefix_samples
-
-            sample_indices = np.append(sample_indices, np.arange(sample_index, sample_index + samples_per_slot))
-            channel_sample_indices = np.append(channel_sample_indices, np.array(sample_index))
-
-            sample_index += samples_per_slot
+        # Each slot starts after its own and all previous cyclic prefixes as well as all previous slots
+        channel_sample_indices = np.cumsum(num_prefix_samples) + samples_per_slot * np.arange(num_slots)
+        sample_indices = channel_sample_indices[np.newaxis, :] + np.arange(samples_per_slot)[:, np.newaxis]
 
-        slot_samples = signal[sample_indices].reshape((samples_per_slot, num_slots), order='F')
+        slot_samples = signal[sample_indices]
         slot_channel_state = channel_state[:, :, channel_sample_indices, :]\
             .to_frequency_selectivity(num_bins=self.frame.num_subcarriers)
 
-        # Transform grid back to data symbols
-        ofdm_grid = fft(slot_samples, n=samples_per_slot, axis=0, norm='ortho')[:self.frame.num_subcarriers, :]
+        # Transform grid back to data symbols,
+        # the slot samples are a copy of the signal and may therefore be overwritten by the transformation
+        ofdm_grid = fft(slot_samples, n=samples_per_slot, axis=0, norm='ortho', workers=-1,
+                        overwrite_x=True)[:self.frame.num_subcarriers, :]
         return ofdm_grid, slot_channel_state
 
     @property
     def resource_mask(self) -> np.ndarray:
 
-        # Initialize the base mask as all false
+        # The mask is rebuilt only if the frame configuration changed since the last access,
+        # since it is required for each modulation and demodulation of the section
         num_subcarriers = self.frame.num_subcarriers
-        mask = np.zeros((len(ElementType), num_subcarriers, len(self.pattern)), dtype=bool)
+        resources = [self.frame.resources[resource_idx] for resource_idx in self.pattern]
+        key = (num_subcarriers, self.num_repetitions,
+               tuple((resource.repetitions, tuple((element.type, element.repetitions) for element in resource.elements))
+                     for resource in resources))
 
-        for word_idx, resource_idx in enumerate(self.pattern):
+        if key == self.__resource_mask_key:
+            return self.__resource_mask
 
-            resource = self.frame.resources[resource_idx]
+        # Initialize the base mask as all false
+        mask = np.zeros((len(ElementType), num_subcarriers, len(self.pattern)), dtype=bool)
+
+        for word_idx, resource in enumerate(resources):
             mask[:, :resource.num_subcarriers, word_idx] = resource.mask
 
-        return np.tile(mask, (1, 1, self.num_repetitions))
+        mask = np.tile(mask, (1, 1, self.num_repetitions))
+        mask.flags.writeable = False
+
+        self.__resource_mask = mask
+        self.__resource_mask_key = key
+
+        return mask
 
     @property
     def num_samples(self) -> int:
@@ -804,8 +820,8 @@ class WaveformGeneratorOfdm(WaveformGenerator, Serializable):
 
     def modulate(self, data_symbols: Symbols) -> Signal:
 
-        # The number of samples in time domain the frame should contain, given the current sample frequency
-        output_signal = np.empty(0, dtype=complex)
+        # Modulated signals of each time-section of the OFDM frame
+        section_signals: List[np.ndarray] = []
 
         # Convert symbols
         data_symbols = data_symbols.raw.flatten()
@@ -821,9 +837,9 @@ class WaveformGeneratorOfdm(WaveformGenerator, Serializable):
             sent_data_symbols += section_num_data_symbols
 
             # Modulate the signal
-            section_signal = section.modulate(section_data_symbols)
-            output_signal = np.append(output_signal, section_signal)
+            section_signals.append(section.modulate(section_data_symbols))
 
+        output_signal = np.concatenate(section_signals) if len(section_signals) > 0 else np.empty(0, dtype=complex)
         signal_model = Signal(output_signal, self.sampling_rate)
         return signal_model
 
@@ -849,9 +865,10 @@ class WaveformGeneratorOfdm(WaveformGenerator, Serializable):
                 sample_index += num_samples
                 continue
 
-            time_indices = np.arange(sample_index, sample_index+num_samples)
-            signal_section = signal[time_indices]
-            channel_state_section = channel_state[:, :, time_indices, :]
+            # Sections are contiguous in time, so slicing provides views instead of copies of signal and channel
+            time_section = slice(sample_index, sample_index+num_samples)
+            signal_section = signal[time_section]
+            channel_state_section = channel_state[:, :, time_section, :]
 
             section_symbol_grid, section_channel_state = section.demodulate(signal_section, channel_state_section)
             section_mask = section.resource_mask
@@ -67,6 +67,7 @@ class WaveformGeneratorPskQam(PilotWaveformGenerator, Serializable):
     _symbol_idx: Optional[np.ndarray]
     _pulse_correlation_matrix: Optional[np.ndarray]
     __symbol_rate: float
+    __pilot_cache: Optional[Tuple[Tuple[int, int, ShapingFilter], np.ndarray]]
 
     def __init__(self,
                  symbol_rate: float = 100e6,
@@ -129,6 +130,7 @@ class WaveformGeneratorPskQam(PilotWaveformGenerator, Serializable):
         self._data_symbol_idx = None
         self._symbol_idx = None
         self._pulse_correlation_matrix = None
+        self.__pilot_cache = None
 
         # Initialize base class
         WaveformGenerator.__init__(self, **kwargs)
@@ -246,13 +248,17 @@ class WaveformGeneratorPskQam(PilotWaveformGenerator, Serializable):
         
     @property
     def pilot(self) -> Signal:
-        
-        pilot = np.zeros(self.oversampling_factor * self.num_preamble_symbols, dtype=complex)
-        pilot[::2*self.oversampling_factor] = 1.
-        pilot[self.oversampling_factor::2 * self.oversampling_factor] = -1.
-        pilot = self.tx_filter.filter(pilot)
 
-        return Signal(pilot, sampling_rate=self.sampling_rate)
+        # The filtered preamble only depends on the frame configuration and is therefore cached
+        configuration = (self.oversampling_factor, self.num_preamble_symbols, self.tx_filter)
+        if self.__pilot_cache is None or self.__pilot_cache[0] != configuration:
+
+            pilot = np.zeros(self.oversampling_factor * self.num_preamble_symbols, dtype=complex)
+            pilot[::2*self.oversampling_factor] = 1.
+            pilot[self.oversampling_factor::2 * self.oversampling_factor] = -1.
+            self.__pilot_cache = (configuration, self.tx_filter.filter(pilot))
+
+        return Signal(self.__pilot_cache[1], sampling_rate=self.sampling_rate)
 
     def map(self, data_bits: np.ndarray) -> Symbols:
         return Symbols(self.__mapping.get_symbols(data_bits))
@@ -761,8 +767,8 @@ class PskQamLeastSquaresChannelEstimation(PskQamChannelEstimation):
         reference[::2] = 1.
         reference[1::2] = -1.
 
-        # Compute channel weight.
-        channel_weight = np.mean(preamble_symbols / reference)
+        # Compute channel weight as the closed-form least-squares solution of a single-tap channel
+        channel_weight = np.vdot(reference, preamble_symbols) / np.vdot(reference, reference).real
 
         # Re-construct csi
         csi = ChannelStateInformation.Ideal(signal.num_samples, signal.num_streams)
@@ -10,6 +10,7 @@ from typing import Type, Tuple
 
 import numpy as np
 from ruamel.yaml import SafeConstructor, SafeRepresenter, Node
+from scipy.fft import fft, ifft
 
 from hermespy.channel import ChannelStateInformation
 from hermespy.core.factory import Serializable
@@ -39,7 +40,7 @@ class DFT(SymbolPrecoder, Serializable):
         Args:
             fft_norm (str, optional):
                 The norm applied to the discrete fourier transform.
-                See also numpy.fft.fft for details
+                See also scipy.fft.fft for details
         """
 
         self.__fft_norm = 'ortho'
@@ -88,16 +89,16 @@ class DFT(SymbolPrecoder, Serializable):
 
     def encode(self, symbol_stream: np.ndarray) -> np.ndarray:
 
-        # There will be an FFT conversion over the antenna streams
-        return np.fft.fft(symbol_stream, axis=1, norm=self.__fft_norm)
+        # There will be an FFT conversion over the antenna streams, the streams are transformed in parallel
+        return fft(symbol_stream, axis=1, norm=self.__fft_norm, workers=-1)
 
     def decode(self,
                symbol_stream: np.ndarray,
                channel_state: ChannelStateInformation,
                stream_noises: np.ndarray) -> Tuple[np.ndarray, ChannelStateInformation, np.ndarray]:
 
-        # There will be an inverse FFT conversion over the antenna streams
-        decoded_stream = np.fft.ifft(symbol_stream, axis=1, norm=self.__fft_norm)
+        # There will be an inverse FFT conversion over the antenna streams, the streams are transformed in parallel
+        decoded_stream = ifft(symbol_stream, axis=1, norm=self.__fft_norm, workers=-1)
         # channel_state.linear = np.fft.ifft(channel_state.linear, axis=2, norm=self.__fft_norm)
 
         return decoded_stream, channel_state, stream_noises
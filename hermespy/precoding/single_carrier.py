@@ -9,7 +9,7 @@ from __future__ import annotations
 from typing import Tuple
 
 import numpy as np
-from numpy import argmax
+from numba import jit
 
 from hermespy.core.channel_state_information import ChannelStateInformation
 from hermespy.core.factory import Serializable
@@ -61,17 +61,60 @@ class SingleCarrier(SymbolPrecoder, Serializable):
         squeezed_channel_state = channel_state.state.sum(axis=1, keepdims=False)
 
         # Select proper antenna for each symbol timestamp
-        antenna_selection = argmax(abs(squeezed_channel_state), axis=0)
+        antenna_selection = self.__select_antennas(
+            squeezed_channel_state.reshape((squeezed_channel_state.shape[0], -1))
+        ).reshape(squeezed_channel_state.shape[1:])
 
         symbol_stream = np.take_along_axis(symbol_stream, antenna_selection.T, axis=0)
         stream_noises = np.take_along_axis(stream_noises, antenna_selection.T, axis=0)
 
-        channel_state_selection = antenna_selection.T[:, np.newaxis, :, np.newaxis]\
-            .repeat(2, axis=1).repeat(channel_state.state.shape[3], axis=3)
+        # The selection broadcasts over all transmit antennas and delay taps of the channel state
+        channel_state_selection = antenna_selection.T[:, np.newaxis, :, np.newaxis]
         channel_state.state = np.take_along_axis(channel_state.state, channel_state_selection, axis=0)
 
         return symbol_stream, channel_state, stream_noises
 
+    @staticmethod
+    @jit(nopython=True, cache=True)
+    def __select_antennas(channel_states: np.ndarray) -> np.ndarray:
+        """Internal subroutine selecting the antenna of strongest channel magnitude.
+
+        Equivalent to an `argmax` of the channel magnitudes along the first axis,
+        but sweeps the antennas row by row instead of striding through each column.
+        Squared magnitudes are compared while reading the channel states,
+        so no intermediate magnitude matrix is required.
+
+        Args:
+
+            channel_states (np.ndarray):
+                Matrix of channel states, the first dimension denoting the receiving antennas.
+
+        Returns:
+            np.ndarray: Vector of antenna indices, the first antenna being selected for equal magnitudes.
+        """
+
+        num_antennas, num_symbols = channel_states.shape
+        antenna_selection = np.zeros(num_symbols, dtype=np.int64)
+        strongest_magnitudes = np.empty(num_symbols, dtype=np.float64)
+
+        for symbol in range(num_symbols):
+
+            state = channel_states[0, symbol]
+            strongest_magnitudes[symbol] = state.real ** 2 + state.imag ** 2
+
+        for antenna in range(1, num_antennas):
+            for symbol in range(num_symbols):
+
+                state = channel_states[antenna, symbol]
+                magnitude = state.real ** 2 + state.imag ** 2
+
+                if magnitude > strongest_magnitudes[symbol]:
+
+                    strongest_magnitudes[symbol] = magnitude
+                    antenna_selection[symbol] = antenna
+
+        return antenna_selection
+
     @property
     def num_input_streams(self) -> int:
         return 1
@@ -270,12 +270,12 @@ class ClippingPowerAmplifier(PowerAmplifier):
 
     def model(self, input_signal: np.ndarray) -> np.ndarray:
 
-        output_signal = input_signal.copy()
+        # Scale samples exceeding the saturation amplitude down to the saturation amplitude, preserving their phase
+        amplitude = np.abs(input_signal)
+        gain = np.divide(self.saturation_amplitude, amplitude, out=np.ones(amplitude.shape, dtype=float),
+                         where=amplitude > self.saturation_amplitude)
 
-        clip_idx = np.nonzero(np.abs(input_signal) > self.saturation_amplitude)
-        output_signal[clip_idx] = self.saturation_amplitude * np.exp(1j * np.angle(input_signal[clip_idx]))
-
-        return output_signal
+        return input_signal * gain
 
 
 class RappPowerAmplifier(PowerAmplifier):
@@ -500,8 +500,9 @@ class SalehPowerAmplifier(PowerAmplifier):
     def model(self, input_signal: np.ndarray) -> np.ndarray:
 
         amp = np.abs(input_signal) / self.saturation_amplitude
-        gain = self.__amplitude_alpha / (1 + self.__amplitude_beta * amp ** 2)
-        phase_shift = self.phase_alpha * amp ** 2 / (1 + self.phase_beta * amp ** 2)
+        amp_squared = amp * amp
+        gain = self.__amplitude_alpha / (1 + self.__amplitude_beta * amp_squared)
+        phase_shift = self.phase_alpha * amp_squared / (1 + self.phase_beta * amp_squared)
 
         return input_signal * gain * np.exp(1j * phase_shift)
 
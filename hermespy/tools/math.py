@@ -11,8 +11,8 @@ Implementations of basic maths equations.
 import numpy as np
 from scipy import stats
 from enum import Enum
-from typing import Optional
-from numba import jit
+from math import log2
+from typing import Dict, Optional, Union
 
 __author__ = "Andre Noll Barreto"
 __copyright__ = "Copyright 2022, Barkhausen Institut gGmbH"
@@ -30,52 +30,76 @@ class DbConversionType(Enum):
     AMPLITUDE = 1
     HILLY = 2
 
-@jit
-def db2lin(db_val: float,
-           conversion_type: Optional[DbConversionType] = DbConversionType.POWER):
+_DB_FACTORS: Dict[DbConversionType, float] = {
+    DbConversionType.POWER: 10.,
+    DbConversionType.AMPLITUDE: 20.,
+}
+"""Decibel scaling factors of the supported conversion types."""
+
+_LOG2_10 = log2(10.)
+"""Binary logarithm of ten, converting decimal into binary exponents."""
+
+
+def db2lin(db_val: Union[float, np.ndarray],
+           conversion_type: Optional[DbConversionType] = DbConversionType.POWER,
+           out: Optional[np.ndarray] = None) -> Union[float, np.ndarray]:
     """
     Converts from dB to linear
 
     Args:
-        db_val (float): value in dB
+        db_val (Union[float, np.ndarray]): value in dB, scalar or array
         conversion_type (DbConversionType, optional): if POWER then it converts from dB to a power ratio
                                                       if AMPLITUDE, then it converts from dB to an amplitude ratio
                                                       default = POWER
+        out (np.ndarray, optional): array the linear values of an array `db_val` are written to
     Returns:
-        (float): the equivalent value in linear scale
+        (Union[float, np.ndarray]): the equivalent value in linear scale
     """
-    if conversion_type == DbConversionType.POWER:
-        output = 10**(db_val/10)
-    elif conversion_type == DbConversionType.AMPLITUDE:
-        output = 10**(db_val/20)
-    else:
+
+    factor = _DB_FACTORS.get(conversion_type, None)
+    if factor is None:
         raise ValueError(f"dB conversion type not supported")
 
-    return output
+    # Powers of ten are evaluated as powers of two, since exp2 is considerably cheaper than pow on arrays
+    exponent_scale = _LOG2_10 / factor
+
+    if out is None:
 
+        if isinstance(db_val, np.ndarray):
+            return np.exp2(db_val * exponent_scale)
 
-@jit
-def lin2db(val: float,
-           conversion_type: Optional[DbConversionType] = DbConversionType.POWER):
+        return 2. ** (db_val * exponent_scale)
+
+    np.multiply(db_val, exponent_scale, out=out)
+    return np.exp2(out, out=out)
+
+
+def lin2db(val: Union[float, np.ndarray],
+           conversion_type: Optional[DbConversionType] = DbConversionType.POWER,
+           out: Optional[np.ndarray] = None) -> Union[float, np.ndarray]:
     """
     Converts from linear to dB
 
     Args:
-        val (float): value in linear scale
+        val (Union[float, np.ndarray]): value in linear scale, scalar or array
         conversion_type (DbConversionType, optional): if POWER then it converts from a power ratio to dB
                                                       if AMPLITUDE, then it converts from an amplitude ratio to dB
                                                       default = POWER
+        out (np.ndarray, optional): array the decibel values of an array `val` are written to
     Returns:
-        (float) the equivalent value in linear scale
+        (Union[float, np.ndarray]) the equivalent value in linear scale
     """
-    if conversion_type == DbConversionType.POWER:
-        output = 10 * np.log10(val)
-    elif conversion_type == DbConversionType.AMPLITUDE:
-        output = 20 * np.log10(val)
-    else:
+
+    factor = _DB_FACTORS.get(conversion_type, None)
+    if factor is None:
         raise ValueError(f"dB conversion type not supported")
 
-    return output
+    if out is None:
+        return factor * np.log10(val)
+
+    np.log10(val, out=out)
+    out *= factor
+    return out
 
 
 def marcum_q(a: float,
@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+"""Test HermesPy command line interface."""
+
+import os
+import unittest
+from tempfile import TemporaryDirectory
+from unittest.mock import Mock, patch
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from hermespy.bin.hermes import hermes, _load_serializables
+from hermespy.core.executable import Executable
+from hermespy.core.random_node import RandomNode
+
+__author__ = "Jan Adler"
+__copyright__ = "Copyright 2022, Barkhausen Institut gGmbH"
+__credits__ = ["Jan Adler"]
+__license__ = "AGPLv3"
+__version__ = "0.2.7"
+__maintainer__ = "Jan Adler"
+__email__ = "jan.adler@barkhauseninstitut.org"
+__status__ = "Prototype"
+
+
+class TestLoadSerializables(unittest.TestCase):
+    """Test the cached recall of serializable objects from settings directories."""
+
+    def setUp(self) -> None:
+
+        self.settings_dir = TemporaryDirectory()
+        self.cache_home = TemporaryDirectory()
+
+        self.configuration_path = os.path.join(self.settings_dir.name, 'configuration.yml')
+        with open(self.configuration_path, 'w') as file:
+            file.write('configuration')
+
+        self.environment = patch.dict(os.environ, {'XDG_CACHE_HOME': self.cache_home.name})
+        self.environment.start()
+
+        self.load = patch('hermespy.bin.hermes.Factory.load', return_value=[1, 2, 3])
+        self.load_mock = self.load.start()
+
+    def tearDown(self) -> None:
+
+        self.load.stop()
+        self.environment.stop()
+        self.cache_home.cleanup()
+        self.settings_dir.cleanup()
+
+    def test_cache_miss(self) -> None:
+        """Configurations should be parsed and cached within the user cache directory on first load."""
+
+        serializables = _load_serializables(self.settings_dir.name)
+
+        self.assertEqual([1, 2, 3], serializables)
+        self.assertEqual(1, self.load_mock.call_count)
+        self.assertEqual(1, len(os.listdir(os.path.join(self.cache_home.name, 'hermespy'))))
+        self.assertEqual(['configuration.yml'], os.listdir(self.settings_dir.name))
+
+    def test_cache_hit(self) -> None:
+        """Unchanged configurations should be recalled from the cache."""
+
+        _ = _load_serializables(self.settings_dir.name)
+        serializables = _load_serializables(self.settings_dir.name)
+
+        self.assertEqual([1, 2, 3], serializables)
+        self.assertEqual(1, self.load_mock.call_count)
+
+    def test_cache_disabled(self) -> None:
+        """Disabling the cache should always parse the configuration."""
+
+        _ = _load_serializables(self.settings_dir.name, False)
+        _ = _load_serializables(self.settings_dir.name, False)
+
+        self.assertEqual(2, self.load_mock.call_count)
+        self.assertFalse(os.path.exists(os.path.join(self.cache_home.name, 'hermespy')))
+
+    def test_configuration_invalidation(self) -> None:
+        """Modifying a configuration file should invalidate the cache."""
+
+        _ = _load_serializables(self.settings_dir.name)
+
+        with open(self.configuration_path, 'a') as file:
+            file.write(' modified')
+
+        _ = _load_serializables(self.settings_dir.name)
+        self.assertEqual(2, self.load_mock.call_count)
+
+    def test_version_invalidation(self) -> None:
+        """Changing the HermesPy version should invalidate the cache."""
+
+        _ = _load_serializables(self.settings_dir.name)
+
+        with patch('hermespy.bin.hermes.__version__', '0.0.0'):
+            _ = _load_serializables(self.settings_dir.name)
+
+        self.assertEqual(2, self.load_mock.call_count)
+
+    def test_cache_unseeded_random_state(self) -> None:
+        """Unseeded random nodes recalled from the cache should draw independent random streams."""
+
+        self.load_mock.return_value = [RandomNode(), RandomNode(seed=42)]
+
+        _ = _load_serializables(self.settings_dir.name)
+        first_unseeded, first_seeded = _load_serializables(self.settings_dir.name)
+        second_unseeded, second_seeded = _load_serializables(self.settings_dir.name)
+
+        self.assertEqual(1, self.load_mock.call_count)
+        self.assertFalse(np.array_equal(first_unseeded._rng.random(3), second_unseeded._rng.random(3)))
+        assert_array_equal(first_seeded._rng.random(3), second_seeded._rng.random(3))
+
+
+class TestHermes(unittest.TestCase):
+    """Test the HermesPy command line interface entry point."""
+
+    def setUp(self) -> None:
+
+        self.settings_dir = TemporaryDirectory()
+        self.results_dir = TemporaryDirectory()
+
+        with open(os.path.join(self.settings_dir.name, 'configuration.yml'), 'w') as file:
+            file.write('configuration')
+
+        self.executable = Mock(spec=Executable)
+        self.load = patch('hermespy.bin.hermes._load_serializables', return_value=[self.executable])
+        self.load_mock = self.load.start()
+
+    def tearDown(self) -> None:
+
+        self.load.stop()
+        self.results_dir.cleanup()
+        self.settings_dir.cleanup()
+
+    def test_configuration_dump(self) -> None:
+        """The configuration should be copied to the results directory."""
+
+        hermes(['-p', self.settings_dir.name, '-o', self.results_dir.name])
+
+        self.assertEqual(['configuration.yml'], os.listdir(self.results_dir.name))
+        self.assertEqual(self.results_dir.name, self.executable.results_dir)
+        self.executable.execute.assert_called_once()
+
+    def test_results_dir_validation(self) -> None:
+        """A non-existing results directory should raise a ValueError before anything is loaded or created."""
+
+        results_dir = os.path.join(self.results_dir.name, 'missing')
+
+        with self.assertRaises(ValueError):
+            hermes(['-p', self.settings_dir.name, '-o', results_dir])
+
+        self.assertFalse(os.path.exists(results_dir))
+        self.load_mock.assert_not_called()
+
+    def test_failed_load(self) -> None:
+        """Failing to load an executable should leave the results directory untouched."""
+
+        self.load_mock.return_value = []
+
+        with self.assertRaises(SystemExit):
+            hermes(['-p', self.settings_dir.name, '-o', self.results_dir.name])
+
+        self.assertEqual([], os.listdir(self.results_dir.name))
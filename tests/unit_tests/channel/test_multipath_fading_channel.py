@@ -141,6 +141,29 @@ class TestMultipathFadingChannel(unittest.TestCase):
         channel = MultipathFadingChannel(**self.channel_params)
         np.testing.assert_array_almost_equal(self.rice_factors, channel.rice_factors)
 
+    def test_gains_get(self) -> None:
+        """Line of sight and non-line of sight gains should be derived from the rice factors and be read-only."""
+
+        self.channel_params['delays'] = np.zeros(3)
+        self.channel_params['power_profile'] = np.ones(3)
+        self.channel_params['rice_factors'] = np.array([0., 1., float('inf')])
+        channel = MultipathFadingChannel(**self.channel_params)
+
+        assert_array_almost_equal(np.array([0., .5 ** .5, 1.]), channel.los_gains)
+        assert_array_almost_equal(np.array([1., .5 ** .5, 0.]), channel.non_los_gains)
+
+        with self.assertRaises(AttributeError):
+            channel.los_gains = np.ones(3)
+
+        with self.assertRaises(ValueError):
+            channel.non_los_gains[0] = 0.
+
+        with self.assertRaises(ValueError):
+            channel.power_profile[0] = 0.
+
+        with self.assertRaises(ValueError):
+            channel.delays[0] = 1.
+
     def test_doppler_frequency_setget(self) -> None:
         """Doppler frequency property getter should return setter argument."""
 
@@ -176,6 +199,24 @@ class TestMultipathFadingChannel(unittest.TestCase):
         channel = MultipathFadingChannel(**self.channel_params)
         self.assertEqual(max(self.channel_params['delays']), channel.max_delay)
 
+    def test_min_sampling_rate(self) -> None:
+        """Minimum sampling rate should resolve the closest distinct path delays."""
+
+        self.channel_params['delays'] = np.array([0., 1e-6, 1e-6, 3e-6])
+        self.channel_params['power_profile'] = np.ones(4)
+        self.channel_params['rice_factors'] = np.zeros(4)
+        self.channel_params['impulse_response_interpolation'] = False
+
+        channel = MultipathFadingChannel(**self.channel_params)
+        self.assertAlmostEqual((1 - channel.delay_resolution_error) * 1e6, channel.min_sampling_rate)
+
+        self.channel_params['delays'] = np.zeros(2)
+        self.channel_params['power_profile'] = np.ones(2)
+        self.channel_params['rice_factors'] = np.zeros(2)
+
+        channel = MultipathFadingChannel(**self.channel_params)
+        self.assertEqual(0., channel.min_sampling_rate)
+
     def test_num_sequences_get(self) -> None:
         """Number of fading sequences property should return core parameter lengths."""
 
@@ -229,6 +270,137 @@ class TestMultipathFadingChannel(unittest.TestCase):
 
         assert_array_almost_equal(first_draw, second_draw)
 
+    def test_interpolation_filter_cache(self) -> None:
+        """Interpolation filters should be generated once per sampling rate."""
+
+        self.channel_params['delays'] = np.array([0., 1.5, 3.]) / self.sampling_rate
+        self.channel_params['power_profile'] = np.ones(3)
+        self.channel_params['rice_factors'] = np.zeros(3)
+        channel = MultipathFadingChannel(**self.channel_params)
+
+        first_filter = channel.interpolation_filter(self.sampling_rate)
+        self.assertIs(first_filter, channel.interpolation_filter(self.sampling_rate))
+
+        with self.assertRaises(ValueError):
+            first_filter[0, 0] = 1.
+
+        second_filter = channel.interpolation_filter(2 * self.sampling_rate)
+        self.assertEqual(7, second_filter.shape[1])
+
+        single_filter = channel.interpolation_filter(self.sampling_rate, np.float32)
+        self.assertEqual(np.float32, single_filter.dtype)
+        assert_array_almost_equal(first_filter, single_filter)
+
+    def test_impulse_response_sampling_changes(self) -> None:
+        """Impulse responses should follow changes of the sampling configuration between calls."""
+
+        self.channel_params['delays'] = np.array([0., 1.5, 3.]) / self.sampling_rate
+        self.channel_params['power_profile'] = np.ones(3)
+        self.channel_params['rice_factors'] = np.zeros(3)
+        channel = MultipathFadingChannel(**self.channel_params)
+
+        self.assertEqual((10, 1, 1, 4), channel.impulse_response(10, self.sampling_rate).shape)
+        self.assertEqual((10, 1, 1, 4), channel.impulse_response(10, self.sampling_rate).shape)
+        self.assertEqual((20, 1, 1, 4), channel.impulse_response(20, self.sampling_rate).shape)
+        self.assertEqual((20, 1, 1, 7), channel.impulse_response(20, 2 * self.sampling_rate).shape)
+
+    def test_impulse_response_antenna_independence(self) -> None:
+        """Each antenna pair should experience an independent fading realization."""
+
+        self.transmitter.num_antennas = 2
+        self.receiver.num_antennas = 2
+        self.channel_params['delays'] = np.array([0., 1.5, 3.]) / self.sampling_rate
+        self.channel_params['power_profile'] = np.ones(3)
+        self.channel_params['rice_factors'] = np.zeros(3)
+        self.channel_params['doppler_frequency'] = 100.
+
+        for interpolation in [True, False]:
+
+            self.channel_params['impulse_response_interpolation'] = interpolation
+            channel = MultipathFadingChannel(**self.channel_params)
+            impulse_response = channel.impulse_response(self.num_samples, self.sampling_rate)
+
+            antenna_responses = impulse_response.transpose((1, 2, 0, 3)).reshape((4, -1))
+            for first_idx in range(4):
+                for second_idx in range(first_idx + 1, 4):
+                    self.assertFalse(np.allclose(antenna_responses[first_idx], antenna_responses[second_idx]))
+
+    def test_impulse_response_path_power(self) -> None:
+        """The mean power of each fading tap should match the configured power profile."""
+
+        self.transmitter.num_antennas = 8
+        self.receiver.num_antennas = 8
+        self.channel_params['delays'] = np.array([0., 1., 2.]) / self.sampling_rate
+        self.channel_params['power_profile'] = np.array([1., .5, .25])
+        self.channel_params['rice_factors'] = np.array([0., 1., float('inf')])
+        self.channel_params['doppler_frequency'] = 100.
+        self.channel_params['impulse_response_interpolation'] = False
+        channel = MultipathFadingChannel(**self.channel_params)
+
+        tap_powers = np.zeros(3, dtype=float)
+        num_drops = 30
+        for _ in range(num_drops):
+
+            impulse_response = channel.impulse_response(1, self.sampling_rate)
+            tap_powers += np.mean(np.abs(impulse_response[0, ...]) ** 2, axis=(0, 1))
+
+        npt.assert_allclose(self.channel_params['power_profile'], tap_powers / num_drops, rtol=.15)
+
+    def test_impulse_response_shared_tap(self) -> None:
+        """Paths sharing a delay tap should be superimposed."""
+
+        self.transmitter.num_antennas = 8
+        self.receiver.num_antennas = 8
+        self.channel_params['delays'] = np.array([0., .4, 1.]) / self.sampling_rate
+        self.channel_params['power_profile'] = np.array([1., .5, .25])
+        self.channel_params['rice_factors'] = np.zeros(3)
+        self.channel_params['impulse_response_interpolation'] = False
+        channel = MultipathFadingChannel(**self.channel_params)
+
+        tap_powers = np.zeros(2, dtype=float)
+        num_drops = 30
+        for _ in range(num_drops):
+
+            impulse_response = channel.impulse_response(1, self.sampling_rate)
+            tap_powers += np.mean(np.abs(impulse_response[0, ...]) ** 2, axis=(0, 1))
+
+        npt.assert_allclose(np.array([1.5, .25]), tap_powers / num_drops, rtol=.15)
+
+    def test_impulse_response_line_of_sight(self) -> None:
+        """A pure line of sight path should have a constant magnitude over time."""
+
+        self.channel_params['power_profile'] = np.array([.5])
+        self.channel_params['rice_factors'] = np.array([float('inf')])
+        self.channel_params['doppler_frequency'] = 1e4
+        self.channel_params['los_angle'] = .25 * pi
+        channel = MultipathFadingChannel(**self.channel_params)
+
+        impulse_response = channel.impulse_response(self.num_samples, self.sampling_rate)
+        npt.assert_array_almost_equal(np.full(self.num_samples, .5 ** .5), np.abs(impulse_response[:, 0, 0, 0]))
+
+    def test_impulse_response_dtype(self) -> None:
+        """Impulse responses should be generated in the requested precision."""
+
+        self.channel_params['delays'] = np.array([0., 1.5, 3.]) / self.sampling_rate
+        self.channel_params['power_profile'] = np.ones(3)
+        self.channel_params['rice_factors'] = np.array([0., 1., float('inf')])
+        self.channel_params['doppler_frequency'] = 100.
+
+        for interpolation in [True, False]:
+
+            self.channel_params['impulse_response_interpolation'] = interpolation
+            channel = MultipathFadingChannel(**self.channel_params)
+
+            channel.set_seed(100)
+            double_response = channel.impulse_response(self.num_samples, self.sampling_rate)
+
+            channel.set_seed(100)
+            single_response = channel.impulse_response(self.num_samples, self.sampling_rate, np.complex64)
+
+            self.assertEqual(np.complex128, double_response.dtype)
+            self.assertEqual(np.complex64, single_response.dtype)
+            assert_array_almost_equal(double_response, single_response, decimal=5)
+
     def test_propagation_siso_no_fading(self) -> None:
         """
         Test the propagation through a SISO multipath channel model without fading
@@ -116,3 +116,30 @@ class TestBlockInterleaver(unittest.TestCase):
         expected_bits = np.arange(self.block_size)
 
         np.testing.assert_array_equal(expected_bits, self.interleaver.decode(code))
+
+    def test_interleaving_multiple_blocks(self) -> None:
+        """Multiple consecutive blocks must be interleaved independently."""
+
+        bits = np.arange(3 * self.block_size)
+        code = self.interleaver.encode(bits)
+
+        for b in range(3):
+
+            block = slice(b * self.block_size, (b + 1) * self.block_size)
+            np.testing.assert_array_equal(self.interleaver.encode(bits[block]), code[block])
+
+        np.testing.assert_array_equal(bits, self.interleaver.decode(code))
+
+    def test_interleaving_large_blocks(self) -> None:
+        """Large blocks transposed in tiles must be interleaved identically to small blocks."""
+
+        block_size = 2 * BlockInterleaver._TILED_BLOCK_SIZE
+        interleave_blocks = 96
+        interleaver = BlockInterleaver(block_size - block_size % interleave_blocks, interleave_blocks)
+
+        bits = np.random.default_rng(42).integers(0, 2, 2 * interleaver.block_size)
+        code = interleaver.encode(bits)
+
+        expected_code = bits.reshape((2, interleave_blocks, -1)).transpose((0, 2, 1)).flatten()
+        np.testing.assert_array_equal(expected_code, code)
+        np.testing.assert_array_equal(bits, interleaver.decode(code))
@@ -60,6 +60,18 @@ class TestRepetitionEncoder(unittest.TestCase):
 
         assert_array_equal(data, code)
 
+    def test_encode_decode_dtypes(self) -> None:
+        """Encoding should preserve the bit type, decoding should always return integer bits."""
+
+        for dtype in [np.uint8, np.int64, np.float64]:
+
+            bits = np.random.randint(0, 2, self.encoder.bit_block_size).astype(dtype)
+            code = self.encoder.encode(bits)
+            decoded_bits = self.encoder.decode(code)
+
+            self.assertEqual(dtype, code.dtype)
+            self.assertEqual(np.int64, decoded_bits.dtype)
+
     def test_encode_block_length(self) -> None:
         """Length of the code block after encoding must match the code block size property."""
 
@@ -104,6 +116,26 @@ class TestRepetitionEncoder(unittest.TestCase):
         data = self.encoder.decode(np.random.randint(0, 2, self.encoder.code_block_size))
         self.assertEqual(len(data), self.encoder.bit_block_size)
 
+    def test_decode_validation(self) -> None:
+        """Decoding should raise a ValueError if the code block length does not match the code block size."""
+
+        with self.assertRaises(ValueError):
+            _ = self.encoder.decode(np.zeros(self.encoder.code_block_size - 1))
+
+        with self.assertRaises(ValueError):
+            _ = self.encoder.decode(np.zeros(self.encoder.code_block_size + 1))
+
+    def test_decoding_soft_values(self) -> None:
+        """Soft code values should be majority-voted by their mean."""
+
+        code = np.zeros((self.repetitions, self.bit_block_size))
+        code[:, 0] = [.4, .4, .4]
+        code[:, 1] = [.6, .6, .6]
+        code[:, 2] = [1., .4, .2]
+
+        data = self.encoder.decode(code.flatten())
+        assert_array_equal(np.array([0, 1, 1, 0, 0, 0, 0, 0]), data)
+
     def test_bit_block_size_setget(self) -> None:
         """Test that the bit block size getter returns the setter value."""
 
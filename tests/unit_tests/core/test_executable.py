@@ -3,6 +3,8 @@
 
 import unittest
 import tempfile
+from datetime import date
+from os import path
 from contextlib import _GeneratorContextManager
 from typing import Type
 from unittest.mock import Mock, patch
@@ -80,6 +82,29 @@ class TestExecutable(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.executable.results_dir = "ad213ijt0923h1o2i3hnjqnda"
 
+    def test_results_dir_revalidation(self) -> None:
+        """Re-assigning the current results directory should not access the filesystem."""
+
+        with tempfile.TemporaryDirectory() as dirname:
+            self.executable.results_dir = dirname
+
+        with patch('hermespy.core.executable.stat') as stat:
+
+            self.executable.results_dir = dirname
+            stat.assert_not_called()
+
+    def test_default_results_dir(self) -> None:
+        """Default results directories should be indexed consecutively per day."""
+
+        with tempfile.TemporaryDirectory() as dirname:
+            with patch('hermespy.core.executable.getcwd', return_value=dirname):
+
+                first_dir = Executable.default_results_dir()
+                second_dir = Executable.default_results_dir()
+
+        self.assertEqual(path.join(dirname, 'results', str(date.today()) + '_000'), first_dir)
+        self.assertEqual(path.join(dirname, 'results', str(date.today()) + '_001'), second_dir)
+
     def test_verbosity_setget(self) -> None:
         """Verbosity property getter should return setter argument."""
 
@@ -4,13 +4,17 @@
 from __future__ import annotations
 import unittest
 import warnings
+from copy import deepcopy
 from unittest.mock import Mock
 from ray.util import inspect_serializability
 
+import numpy as np
 import ray
+from numpy.testing import assert_array_equal
 
 from hermespy.core.monte_carlo import MonteCarlo, MonteCarloActor, MonteCarloSample, \
     Evaluator, ArtifactTemplate, MO, Artifact, GridDimension
+from hermespy.core.random_node import RandomNode
 
 __author__ = "Jan Adler"
 __copyright__ = "Copyright 2022, Barkhausen Institut gGmbH"
@@ -184,6 +188,35 @@ class MonteCarloActorMock(MonteCarloActor[TestObjectMock]):
         return self._investigated_object
 
 
+class RandomActorMock(MonteCarloActor[RandomNode]):
+    """Mock of a Monte Carlo Actor investigating a random node."""
+
+    def sample(self) -> RandomNode:
+        return self._investigated_object
+
+
+class TestMonteCarloActor(unittest.TestCase):
+    """Test the Monte Carlo actor base class."""
+
+    def setUp(self) -> None:
+
+        self.investigated_object = RandomNode(seed=42)
+
+    def test_init_seed(self) -> None:
+        """Actors initialized with different seeds should draw independent random streams."""
+
+        actor_alpha = RandomActorMock((deepcopy(self.investigated_object), [], [], 1))
+        actor_beta = RandomActorMock((deepcopy(self.investigated_object), [], [], 2))
+        actor_gamma = RandomActorMock((deepcopy(self.investigated_object), [], [], 1))
+
+        draw_alpha = actor_alpha.sample()._rng.normal(size=10)
+        draw_beta = actor_beta.sample()._rng.normal(size=10)
+        draw_gamma = actor_gamma.sample()._rng.normal(size=10)
+
+        self.assertFalse(np.array_equal(draw_alpha, draw_beta))
+        assert_array_equal(draw_alpha, draw_gamma)
+
+
 class TestMonteCarloSample(unittest.TestCase):
     """Test the Monte Carlo sample class."""
 
@@ -305,6 +338,25 @@ class TestMonteCarlo(unittest.TestCase):
         self.assertEqual(self.num_samples, self.monte_carlo.num_samples)
         self.assertEqual(self.num_actors, self.monte_carlo.num_actors)
 
+    def test_actor_seeds(self) -> None:
+        """Actor seeds should be distinct and reproducible for seeded investigated objects."""
+
+        seeds = []
+        for _ in range(2):
+
+            with warnings.catch_warnings():
+
+                warnings.simplefilter("ignore")
+                monte_carlo = MonteCarlo(investigated_object=RandomNode(seed=42),
+                                         evaluators=self.evaluators,
+                                         num_samples=self.num_samples,
+                                         num_actors=4)
+
+            seeds.append(monte_carlo._MonteCarlo__actor_seeds())
+
+        self.assertEqual(4, len(set(seeds[0])))
+        self.assertEqual(seeds[0], seeds[1])
+
     def test_new_dimension(self) -> None:
         """Test adding a new grid dimension."""
 
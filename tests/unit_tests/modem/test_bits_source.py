@@ -51,6 +51,27 @@ class TestRandomBitsSource(TestCase):
             # Assert that all bits are actually either zeros or ones
             self.assertEqual(True, np.any((bits == 1) | (bits == 0)))
 
+    def test_get_bits_lengths(self) -> None:
+        """Bit generation should support lengths which are not multiples of the raw draw size."""
+
+        for number_of_bits in [0, 1, 63, 64, 65, 1000]:
+
+            bits = self.source.generate_bits(number_of_bits)
+            self.assertEqual(number_of_bits, len(bits))
+            self.assertEqual(np.uint8, bits.dtype)
+
+        bits = self.source.generate_bits(100000)
+        self.assertAlmostEqual(.5, np.mean(bits), places=2)
+
+    def test_get_bits_batched(self) -> None:
+        """Batched bit generation should return bit tensors of the requested shape."""
+
+        bits = self.source.generate_bits_batched((20, 123))
+
+        self.assertEqual((20, 123), bits.shape)
+        self.assertEqual(np.uint8, bits.dtype)
+        self.assertTrue(np.all((bits == 1) | (bits == 0)))
+
 
 class TestStreamBitsSource(TestCase):
 
@@ -76,3 +97,32 @@ class TestStreamBitsSource(TestCase):
         text = np.packbits(bits).tobytes()
 
         self.assertEqual(self.text, text)
+
+    def test_get_bits_batched(self) -> None:
+        """Batched bit generation should read consecutive bit sequences from the stream."""
+
+        bits = self.source.generate_bits_batched((len(self.text), 8))
+        text = np.packbits(bits).tobytes()
+
+        self.assertEqual(self.text, text)
+
+    def test_get_bits_partial_bytes(self) -> None:
+        """Bits of partially consumed bytes should be generated by subsequent calls."""
+
+        bits = np.concatenate([self.source.generate_bits(num_bits) for num_bits in [3, 5, 13, 0, 1, 2, 64]])
+        text = np.packbits(bits).tobytes()
+
+        self.assertEqual(self.text, text)
+
+    def test_close(self) -> None:
+        """Closed sources should release their stream, also when used as context managers."""
+
+        with StreamBitsSource(self.file_path) as source:
+            bits = source.generate_bits(8)
+
+        self.assertEqual(self.text[:1], np.packbits(bits).tobytes())
+
+        with self.assertRaises(ValueError):
+            source.generate_bits(8)
+
+        source.close()
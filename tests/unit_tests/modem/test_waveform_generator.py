@@ -7,6 +7,7 @@ from typing import Tuple
 
 import numpy as np
 import numpy.random as rnd
+from numpy.testing import assert_array_equal
 from scipy.constants import pi
 from math import floor
 
@@ -108,6 +109,55 @@ class TestSynchronization(unittest.TestCase):
         frames = self.synchronization.synchronize(signal, csi)
         self.assertEqual(num_frames, len(frames))
 
+    def test_synchronize_frame_sections(self) -> None:
+        """Default synchronization should slice signal and channel state into consecutive frame sections."""
+
+        num_frames = 4
+        num_delay_taps = 3
+        samples_per_frame = self.waveform_generator.samples_in_frame
+        num_samples = num_frames * samples_per_frame
+
+        signal = np.exp(2j * self.rng.uniform(0, pi, num_samples))
+        state = self.rng.normal(size=(1, 2, num_samples - num_delay_taps + 1, num_delay_taps))
+        csi = ChannelStateInformation(ChannelStateFormat.IMPULSE_RESPONSE, state)
+
+        frames = self.synchronization.synchronize(signal, csi)
+        self.assertEqual(num_frames, len(frames))
+
+        for f, (frame_signal, frame_csi) in enumerate(frames):
+
+            frame_section = slice(f * samples_per_frame, (1 + f) * samples_per_frame)
+            assert_array_equal(signal[frame_section], frame_signal)
+            assert_array_equal(state[:, :, frame_section, :], frame_csi.state)
+            self.assertEqual(num_delay_taps, frame_csi.num_delay_taps)
+
+    def test_synchronize_stack(self) -> None:
+        """Stacked synchronization should hold the same frame sections as the listed synchronization."""
+
+        num_frames = 4
+        num_delay_taps = 3
+        samples_per_frame = self.waveform_generator.samples_in_frame
+        num_samples = num_frames * samples_per_frame
+
+        signal = np.exp(2j * self.rng.uniform(0, pi, num_samples))
+        state = self.rng.normal(size=(1, 2, num_samples - num_delay_taps + 1, num_delay_taps))
+        csi = ChannelStateInformation(ChannelStateFormat.IMPULSE_RESPONSE, state)
+
+        frame_samples, state_frames = self.synchronization.synchronize_stack(signal, csi)
+        frames = self.synchronization.synchronize(signal, csi)
+
+        self.assertEqual((num_frames, samples_per_frame), frame_samples.shape)
+        self.assertEqual((1, 2, num_frames, samples_per_frame, num_delay_taps), state_frames.shape)
+
+        for f, (frame_signal, frame_csi) in enumerate(frames):
+
+            assert_array_equal(frame_signal, frame_samples[f, :])
+            assert_array_equal(frame_csi.state, state_frames[:, :, f, :frame_csi.num_samples, :])
+
+        # State samples beyond the channel state should be zero
+        assert_array_equal(np.zeros((1, 2, num_delay_taps - 1, num_delay_taps)),
+                           state_frames[:, :, -1, samples_per_frame - num_delay_taps + 1:, :])
+
 
 class TestWaveformGenerator(unittest.TestCase):
     """Test the communication waveform generator unit."""
@@ -140,6 +190,14 @@ class TestWaveformGenerator(unittest.TestCase):
 
         self.assertEqual(order, self.waveform_generator.modulation_order)
 
+    def test_bits_per_symbol(self) -> None:
+        """Bits per symbol should be the binary logarithm of the modulation order."""
+
+        for bits_per_symbol in range(9):
+
+            self.waveform_generator.modulation_order = 2 ** bits_per_symbol
+            self.assertEqual(bits_per_symbol, self.waveform_generator.bits_per_symbol)
+
     def test_modulation_order_validation(self) -> None:
         """Modulation order property setter should raise ValueErrors on arguments which aren't powers of two."""
 
@@ -241,6 +241,22 @@ class TestFrameSymbolSection(unittest.TestCase):
     def test_resource_mask(self) -> None:
         _ = self.section.resource_mask
 
+    def test_resource_mask_configuration_change(self) -> None:
+        """The resource mask should be rebuilt after the frame configuration changed."""
+
+        mask = self.section.resource_mask
+        self.assertIs(mask, self.section.resource_mask)
+        self.assertFalse(mask.flags.writeable)
+
+        self.elements_a[0].type = ElementType.NULL
+        updated_mask = self.section.resource_mask
+
+        self.assertEqual(self.section.num_symbols, np.sum(updated_mask[ElementType.DATA.value]))
+        self.assertLess(np.sum(updated_mask[ElementType.DATA.value]), np.sum(mask[ElementType.DATA.value]))
+
+        self.section.num_repetitions = 3
+        self.assertEqual(3 * len(self.pattern), self.section.resource_mask.shape[2])
+
     def test_num_samples(self) -> None:
         """Number of samples property should compute the correct sample count."""
 
@@ -407,3 +423,19 @@ class TestWaveformGeneratorOFDM(unittest.TestCase):
         symbols, _, _ = self.generator.demodulate(baseband_signal.samples[0, :], channel_state)
 
         assert_array_almost_equal(expected_symbols.raw, symbols.raw)
+
+    def test_demodulate_preserves_inputs(self) -> None:
+        """Demodulation should not alter the received signal or the channel state passed in."""
+
+        symbols = Symbols(np.exp(2j * self.rng.uniform(0, pi, self.generator.symbols_per_frame)))
+        baseband_signal = self.generator.modulate(symbols)
+
+        samples = baseband_signal.samples[0, :]
+        samples_copy = samples.copy()
+        channel_state = ChannelStateInformation.Ideal(num_samples=baseband_signal.num_samples)
+        state_copy = channel_state.state.copy()
+
+        _ = self.generator.demodulate(samples, channel_state)
+
+        assert_array_equal(samples_copy, samples)
+        assert_array_equal(state_copy, channel_state.state)
@@ -11,7 +11,9 @@ from scipy.constants import pi
 
 from hermespy.core.channel_state_information import ChannelStateInformation
 from hermespy.modem.modem import Symbols
-from hermespy.modem.waveform_generator_psk_qam import WaveformGeneratorPskQam, PskQamCorrelationSynchronization
+from hermespy.core.signal_model import Signal
+from hermespy.modem.waveform_generator_psk_qam import WaveformGeneratorPskQam, PskQamCorrelationSynchronization, \
+    PskQamLeastSquaresChannelEstimation
 from hermespy.modem.tools import ShapingFilter
 
 __author__ = "Andre Noll Barreto"
@@ -193,6 +195,19 @@ class TestWaveformGeneratorPskQam(TestCase):
 
         self.assertEqual(signal.num_samples, self.generator.samples_in_frame)
 
+    def test_pilot(self) -> None:
+        """The pilot should be the filtered preamble section of a frame, considering reconfigurations."""
+
+        for num_preamble_symbols in [2, 5]:
+
+            self.generator.num_preamble_symbols = num_preamble_symbols
+
+            preamble = np.zeros(self.oversampling_factor * num_preamble_symbols, dtype=complex)
+            preamble[::2 * self.oversampling_factor] = 1.
+            preamble[self.oversampling_factor::2 * self.oversampling_factor] = -1.
+
+            assert_array_almost_equal(self.tx_filter.filter(preamble), self.generator.pilot.samples[0, :])
+
     def test_pilot_rate_validation(self) -> None:
         """Pilot rate property should raise ValueError on arguments smaller than zero."""
 
@@ -333,6 +348,20 @@ class TestPskQamCorrelationSynchronization(TestCase):
             self.assertEqual(len(frames), 1)
             assert_array_equal(frames[0][0], signal.samples[0, :])
 
+    def test_delay_synchronization_stack(self) -> None:
+        """Stacked synchronization should gather the frames detected by correlation."""
+
+        bits = self.rng.integers(0, 2, self.waveform.bits_per_frame)
+        signal = self.waveform.modulate(self.waveform.map(bits))
+        samples = np.append(np.zeros(10, dtype=complex), signal.samples[0, :])
+
+        channel_state = ChannelStateInformation.Ideal(len(samples))
+        frame_samples, state_frames = self.synchronization.synchronize_stack(samples, channel_state)
+
+        self.assertEqual((1, self.waveform.samples_in_frame), frame_samples.shape)
+        self.assertEqual((1, 1, 1, self.waveform.samples_in_frame, 1), state_frames.shape)
+        assert_array_equal(signal.samples[0, :], frame_samples[0, :])
+
     def test_phase_shift_synchronization(self) -> None:
         """Test synchronization with arbitrary sample offset and phase shift."""
 
@@ -346,3 +375,46 @@ class TestPskQamCorrelationSynchronization(TestCase):
 
         self.assertEqual(len(frames), 1)
         assert_array_almost_equal(frames[0][0], samples)
+
+    def test_pilot_reconfiguration_synchronization(self) -> None:
+        """Synchronization should consider pilot reconfigurations between subsequent calls."""
+
+        for num_preamble_symbols in [10, 20]:
+
+            self.waveform.num_preamble_symbols = num_preamble_symbols
+
+            bits = self.rng.integers(0, 2, self.waveform.bits_per_frame)
+            signal = self.waveform.modulate(self.waveform.map(bits))
+            samples = np.append(np.zeros(10, dtype=complex), signal.samples[0, :])
+
+            frames = self.synchronization.synchronize(samples, ChannelStateInformation.Ideal(len(samples)))
+
+            self.assertEqual(len(frames), 1)
+            assert_array_almost_equal(frames[0][0], signal.samples[0, :])
+
+
+class TestPskQamLeastSquaresChannelEstimation(TestCase):
+    """Test the least-squares channel estimation routine."""
+
+    def setUp(self) -> None:
+
+        self.rng = default_rng(42)
+        self.estimation = PskQamLeastSquaresChannelEstimation()
+        self.waveform = WaveformGeneratorPskQam(oversampling_factor=4)
+        self.waveform.channel_estimation = self.estimation
+        self.waveform.num_preamble_symbols = 10
+        self.waveform.num_data_symbols = 50
+
+    def test_estimate_channel(self) -> None:
+        """The estimated channel weight should scale linearly with the weight applied to the received signal."""
+
+        weight = 0.5 * np.exp(0.3j * pi)
+
+        bits = self.rng.integers(0, 2, self.waveform.bits_per_frame)
+        transmission = self.waveform.modulate(self.waveform.map(bits))
+        filtered_samples = self.waveform.rx_filter.filter(transmission.samples[0, :])
+
+        reference_csi = self.estimation.estimate_channel(Signal(filtered_samples, self.waveform.sampling_rate))
+        csi = self.estimation.estimate_channel(Signal(weight * filtered_samples, self.waveform.sampling_rate))
+
+        assert_array_almost_equal(weight * reference_csi.state, csi.state)
@@ -54,6 +54,23 @@ class TestPskQamMapping(unittest.TestCase):
 
         np.testing.assert_array_almost_equal(symbols_expected, symbols)
 
+    def test_symbols_mapping_replaced(self) -> None:
+        psk_qam_mapping = PskQamMapping(4, np.array([1, 2, 3, 4]))
+        _ = psk_qam_mapping.get_symbols(np.array([0, 0]))
+
+        psk_qam_mapping.mapping = np.array([5, 6, 7, 8])
+        symbols = psk_qam_mapping.get_symbols(np.array([1, 1, 0, 1]))
+
+        np.testing.assert_array_equal(np.array([8, 6]), symbols)
+
+    def test_symbols_unsigned_bits(self) -> None:
+        for modulation_order in [2, 4, 8, 16, 64, 256]:
+            psk_qam_mapping = PskQamMapping(modulation_order)
+            bits = np.random.default_rng(42).integers(0, 2, 10 * psk_qam_mapping.bits_per_symbol)
+
+            np.testing.assert_array_equal(psk_qam_mapping.get_symbols(bits),
+                                          psk_qam_mapping.get_symbols(bits.astype(np.uint8)))
+
     def test_symbols_bpsk(self) -> None:
         bpsk_symbols = np.array([1, -1, -1, 1])
         bits = np.array([0, 1, 1, 0])
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""Test Discrete Fourier Transform precoding."""
+
+import unittest
+from unittest.mock import Mock
+
+import numpy as np
+from numpy.testing import assert_array_almost_equal, assert_array_equal
+
+from hermespy.precoding import DFT
+
+__author__ = "Jan Adler"
+__copyright__ = "Copyright 2022, Barkhausen Institut gGmbH"
+__credits__ = ["Jan Adler"]
+__license__ = "AGPLv3"
+__version__ = "0.2.7"
+__maintainer__ = "Jan Adler"
+__email__ = "jan.adler@barkhauseninstitut.org"
+__status__ = "Prototype"
+
+
+class TestDFT(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        self.generator = np.random.default_rng(42)
+        self.precoder = DFT()
+
+    def test_encode(self) -> None:
+        """Encoding should apply an orthonormal DFT over the symbols of each stream without altering the input."""
+
+        symbol_stream = self.generator.normal(size=(4, 64)) + 1j * self.generator.normal(size=(4, 64))
+        input_copy = symbol_stream.copy()
+
+        encoded_stream = self.precoder.encode(symbol_stream)
+
+        assert_array_almost_equal(np.fft.fft(input_copy, axis=1, norm='ortho'), encoded_stream)
+        assert_array_equal(input_copy, symbol_stream)
+
+    def test_encode_decode_circular(self) -> None:
+        """Encoding and subsequently decoding a data stream should lead to identical symbols."""
+
+        symbol_stream = self.generator.normal(size=(4, 64)) + 1j * self.generator.normal(size=(4, 64))
+        channel_state = Mock()
+        stream_noises = self.generator.random((4, 64))
+
+        decoded_stream, decoded_state, decoded_noises = self.precoder.decode(self.precoder.encode(symbol_stream),
+                                                                             channel_state, stream_noises)
+
+        assert_array_almost_equal(symbol_stream, decoded_stream)
+        self.assertIs(channel_state, decoded_state)
+        assert_array_equal(stream_noises, decoded_noises)
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""Test Single Carrier receive diversity precoding."""
+
+import unittest
+
+import numpy as np
+from numpy.testing import assert_array_equal
+
+from hermespy.core.channel_state_information import ChannelStateFormat, ChannelStateInformation
+from hermespy.precoding import SingleCarrier
+
+__author__ = "Jan Adler"
+__copyright__ = "Copyright 2022, Barkhausen Institut gGmbH"
+__credits__ = ["Jan Adler"]
+__license__ = "AGPLv3"
+__version__ = "0.2.7"
+__maintainer__ = "Jan Adler"
+__email__ = "jan.adler@barkhauseninstitut.org"
+__status__ = "Prototype"
+
+
+class TestSingleCarrier(unittest.TestCase):
+
+    def setUp(self) -> None:
+
+        self.generator = np.random.default_rng(42)
+        self.precoder = SingleCarrier()
+
+        self.num_rx = 3
+        self.num_samples = 20
+
+    def __decode(self, num_tx: int):
+
+        state = self.generator.normal(size=(self.num_rx, num_tx, self.num_samples, 1)) + \
+            1j * self.generator.normal(size=(self.num_rx, num_tx, self.num_samples, 1))
+        symbol_stream = self.generator.normal(size=(self.num_rx, self.num_samples))
+        stream_noises = self.generator.normal(size=(self.num_rx, self.num_samples))
+
+        channel_state = ChannelStateInformation(ChannelStateFormat.IMPULSE_RESPONSE, state.copy())
+        decoding = self.precoder.decode(symbol_stream, channel_state, stream_noises)
+
+        return state, symbol_stream, stream_noises, decoding
+
+    def test_decode_selection(self) -> None:
+        """Decoding should select the receive antenna with the strongest response for each symbol."""
+
+        for num_tx in [1, 2]:
+
+            state, symbol_stream, stream_noises, (symbols, channel_state, noises) = self.__decode(num_tx)
+            selection = np.argmax(abs(state.sum(axis=1)[:, :, 0]), axis=0)
+            samples = np.arange(self.num_samples)
+
+            assert_array_equal(symbol_stream[selection, samples][np.newaxis, :], symbols)
+            assert_array_equal(stream_noises[selection, samples][np.newaxis, :], noises)
+            assert_array_equal(state[selection, :, samples, :].transpose((1, 0, 2))[np.newaxis, ...],
+                               channel_state.state)
+
+    def test_decode_transmit_antennas(self) -> None:
+        """The decoded channel state should keep the number of transmit antennas."""
+
+        for num_tx in [1, 2, 3]:
+
+            _, _, _, (_, channel_state, _) = self.__decode(num_tx)
+            self.assertEqual((1, num_tx, self.num_samples, 1), channel_state.state.shape)
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Test HermesPy math tools."""
+
+import unittest
+
+import numpy as np
+from numpy.testing import assert_array_almost_equal
+
+from hermespy.tools import db2lin, lin2db, DbConversionType
+
+__author__ = "Jan Adler"
+__copyright__ = "Copyright 2022, Barkhausen Institut gGmbH"
+__credits__ = ["Jan Adler"]
+__license__ = "AGPLv3"
+__version__ = "0.2.7"
+__maintainer__ = "Jan Adler"
+__email__ = "jan.adler@barkhauseninstitut.org"
+__status__ = "Prototype"
+
+
+class TestDbConversion(unittest.TestCase):
+
+    def test_db2lin(self) -> None:
+        """Decibel values should be converted to power and amplitude ratios."""
+
+        self.assertAlmostEqual(100., db2lin(20.))
+        self.assertAlmostEqual(10., db2lin(20., DbConversionType.AMPLITUDE))
+        assert_array_almost_equal(np.array([1., 10., .1]), db2lin(np.array([0., 10., -10.])))
+
+    def test_lin2db(self) -> None:
+        """Power and amplitude ratios should be converted to decibel values."""
+
+        self.assertAlmostEqual(20., lin2db(100.))
+        self.assertAlmostEqual(20., lin2db(10., DbConversionType.AMPLITUDE))
+        assert_array_almost_equal(np.array([0., 10., -10.]), lin2db(np.array([1., 10., .1])))
+
+    def test_conversion_output_buffer(self) -> None:
+        """Array conversions should be written to provided output buffers."""
+
+        buffer = np.empty(3)
+
+        linear = db2lin(np.array([0., 20., -20.]), DbConversionType.AMPLITUDE, out=buffer)
+        self.assertIs(buffer, linear)
+        assert_array_almost_equal(np.array([1., 10., .1]), buffer)
+
+        decibels = lin2db(np.array([1., 10., .1]), out=buffer)
+        self.assertIs(buffer, decibels)
+        assert_array_almost_equal(np.array([0., 10., -10.]), buffer)
+
+    def test_conversion_validation(self) -> None:
+        """Unsupported conversion types should raise a ValueError."""
+
+        with self.assertRaises(ValueError):
+            _ = db2lin(1., DbConversionType.HILLY)
+
+        with self.assertRaises(ValueError):
+            _ = lin2db(1., DbConversionType.HILLY)